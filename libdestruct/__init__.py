@@ -17,7 +17,8 @@ from libdestruct.common.attributes import offset
 from libdestruct.common.enum import enum, enum_of
 from libdestruct.common.ptr import ptr
 from libdestruct.common.struct import ptr_to, ptr_to_self, struct
-from libdestruct.libdestruct import inflate, inflater
+from libdestruct.common.walk import explore, walk
+from libdestruct.libdestruct import dtype_of, inflate, inflater
 
 __all__ = [
     "array",
@@ -28,12 +29,15 @@ __all__ = [
     "c_str",
     "c_uint",
     "c_ulong",
+    "dtype_of",
     "enum",
     "enum_of",
+    "explore",
     "inflate",
     "inflater",
     "struct",
     "ptr",
     "ptr_to",
     "ptr_to_self",
+    "walk",
 ]
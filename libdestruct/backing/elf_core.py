@@ -0,0 +1,155 @@
+#
+# This file is part of libdestruct (https://github.com/mrindeciso/libdestruct).
+# Copyright (c) 2024 Roberto Alessandro Bertolini. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+from __future__ import annotations
+
+import struct
+from typing import TYPE_CHECKING
+
+from libdestruct.backing.mapped_memory import MappedMemory
+from libdestruct.backing.memory_map import MemoryMap
+
+if TYPE_CHECKING:  # pragma: no cover
+    from os import PathLike
+
+ELF_MAGIC = b"\x7fELF"
+"""The magic bytes at the start of an ELF file."""
+
+ELF_CLASS_32 = 1
+"""The value of EI_CLASS for 32-bit ELF files."""
+
+ELF_CLASS_64 = 2
+"""The value of EI_CLASS for 64-bit ELF files."""
+
+ELF_DATA_LSB = 1
+"""The value of EI_DATA for little-endian ELF files."""
+
+ELF_DATA_MSB = 2
+"""The value of EI_DATA for big-endian ELF files."""
+
+PT_LOAD = 1
+"""The program header type of a loadable segment."""
+
+PF_X = 0x1
+"""The flag of an executable segment."""
+
+PF_W = 0x2
+"""The flag of a writable segment."""
+
+PF_R = 0x4
+"""The flag of a readable segment."""
+
+PN_XNUM = 0xFFFF
+"""The value of e_phnum when the actual number of program headers is stored in the first section header."""
+
+NOT_DUMPED = "[not dumped]"
+"""The path of the regions of the memory map which were not stored in the core file."""
+
+# Layouts of the ELF structures, after e_ident, indexed by EI_CLASS
+ELF_HEADER = {ELF_CLASS_32: "HHIIIIIHHHHHH", ELF_CLASS_64: "HHIQQQIHHHHHH"}
+PROGRAM_HEADER = {ELF_CLASS_32: "IIIIIIII", ELF_CLASS_64: "IIQQQQQQ"}
+SECTION_HEADER_INFO = {ELF_CLASS_32: (28, "I"), ELF_CLASS_64: (44, "I")}
+
+
+class ElfCore(MappedMemory):
+    """The memory image of an ELF core file, indexed by its PT_LOAD segments.
+
+    The program headers are parsed once, and every segment is indexed by virtual address, so that address lookups are
+    a bisection. The part of a segment which is not stored in the file (p_memsz > p_filesz) was not dumped, rather
+    than being zero-filled, so it is left out of the image and of its memory map unless zero-filling is requested.
+    """
+
+    endianness: str
+    """The endianness of the core file."""
+
+    load_segments: list[tuple[int, int, int]]
+    """The PT_LOAD segments, as (virtual address, size in memory, flags) tuples sorted by virtual address."""
+
+    def __init__(self: ElfCore, path: str | PathLike, writable: bool = False, zero_fill: bool = False) -> None:
+        """Map an ELF core file in memory.
+
+        Args:
+            path: The path of the core file.
+            writable: Whether writes are allowed. Writes are copy-on-write and are never written back to the file.
+            zero_fill: Whether the parts of the segments which were not dumped read as zeroes, instead of being
+                unmapped. They are marked with the "[not dumped]" path in the memory map.
+        """
+        super().__init__(path, segments=[], writable=writable)
+
+        try:
+            self._parse_headers(zero_fill)
+        except BaseException:
+            # The file is not a valid core file, so it must not stay mapped
+            self.close()
+            raise
+
+    def _parse_headers(self: ElfCore, zero_fill: bool) -> None:
+        """Parse the ELF header and the program headers, and index the PT_LOAD segments."""
+        ident = bytes(self._view[:16])
+
+        if ident[:4] != ELF_MAGIC:
+            raise ValueError("The file is not an ELF file.")
+
+        elf_class, elf_data = ident[4], ident[5]
+
+        if elf_class not in ELF_HEADER or elf_data not in (ELF_DATA_LSB, ELF_DATA_MSB):
+            raise ValueError("Unsupported ELF class or data encoding.")
+
+        self.endianness = "little" if elf_data == ELF_DATA_LSB else "big"
+        byte_order = "<" if elf_data == ELF_DATA_LSB else ">"
+
+        header = struct.unpack_from(byte_order + ELF_HEADER[elf_class], self.memory, 16)
+        phoff, shoff, phentsize, phnum = header[4], header[5], header[8], header[9]
+
+        if phnum == PN_XNUM:
+            # The number of program headers is stored in sh_info of the first section header
+            info_offset, info_format = SECTION_HEADER_INFO[elf_class]
+            (phnum,) = struct.unpack_from(byte_order + info_format, self.memory, shoff + info_offset)
+
+        program_header = struct.Struct(byte_order + PROGRAM_HEADER[elf_class])
+        segments = []
+        regions = []
+        self.load_segments = []
+
+        for index in range(phnum):
+            fields = program_header.unpack_from(self.memory, phoff + index * phentsize)
+
+            if elf_class == ELF_CLASS_64:
+                p_type, p_flags, p_offset, p_vaddr, _, p_filesz, p_memsz, _ = fields
+            else:
+                p_type, p_offset, p_vaddr, _, p_filesz, p_memsz, p_flags, _ = fields
+
+            if p_type != PT_LOAD or not p_memsz:
+                continue
+
+            self.load_segments.append((p_vaddr, p_memsz, p_flags))
+
+            file_size = min(p_filesz, p_memsz)
+            permissions = flags_to_permissions(p_flags)
+
+            if file_size:
+                segments.append((p_vaddr, file_size, p_offset))
+                regions.append((p_vaddr, p_vaddr + file_size, permissions, ""))
+
+            if p_memsz > file_size and zero_fill:
+                segments.append((p_vaddr + file_size, p_memsz - file_size, None))
+                regions.append((p_vaddr + file_size, p_vaddr + p_memsz, permissions, NOT_DUMPED))
+
+        self.load_segments.sort()
+        self._set_segments(segments)
+
+        # The memory map carries the permissions of the segments, rather than those of the mapping
+        self._memory_map = MemoryMap(regions)
+
+
+def flags_to_permissions(flags: int) -> str:
+    """Convert the flags of a program header into the /proc/pid/maps permission notation."""
+    return (
+        ("r" if flags & PF_R else "-")
+        + ("w" if flags & PF_W else "-")
+        + ("x" if flags & PF_X else "-")
+        + "p"
+    )
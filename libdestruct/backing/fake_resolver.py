@@ -6,7 +6,13 @@
 
 from __future__ import annotations
 
-from libdestruct.backing.resolver import Resolver
+from libdestruct.backing.resolver import PAGE_SIZE, Resolver
+
+PAGE_MASK = PAGE_SIZE - 1
+"""The mask of the offset of an address in its page."""
+
+ZERO_PAGE = bytes(PAGE_SIZE)
+"""The content of a page which was never written."""
 
 
 class FakeResolver(Resolver):
@@ -21,14 +27,12 @@ class FakeResolver(Resolver):
 
     def resolve_address(self: FakeResolver) -> int:
         """Resolves self's address, mainly used by children to determine their own address."""
-        if self.address is not None:
-            return self.address
-
-        return self.parent.resolve_address() + self.offset
+        return self.address
 
     def relative_from_own(self: FakeResolver, address_offset: int, _: int) -> FakeResolver:
-        """Creates a resolver that references a parent, such that a change in the parent is propagated on the child."""
-        new_resolver = FakeResolver(self.memory, None)
+        """Creates a resolver at an offset from its parent, which caches its address until `invalidate()` is called."""
+        # The absolute address is computed once here, so that no parent chain has to be walked on access
+        new_resolver = FakeResolver(self.memory, self.address + address_offset)
         new_resolver.parent = self
         new_resolver.offset = address_offset
         return new_resolver
@@ -39,36 +43,47 @@ class FakeResolver(Resolver):
 
     def resolve(self: FakeResolver, size: int, _: int) -> bytes:
         """Resolves itself, providing the bytes it references for the specified size and index."""
-        address = self.resolve_address()
+        address = self.address
         # We store data in the dictionary as 4K pages
-        page_address = address & ~0xFFF
-        page_offset = address & 0xFFF
+        page_address = address & ~PAGE_MASK
+        page_offset = address & PAGE_MASK
 
-        result = b""
+        # Fast path: the range is contained in a single page
+        if page_offset + size <= PAGE_SIZE:
+            page = self.memory.get(page_address, ZERO_PAGE)
+            return bytes(memoryview(page)[page_offset : page_offset + size])
+
+        chunks = []
 
         while size:
-            page = self.memory.get(page_address, b"\x00" * (0x1000 - page_offset))
-            page_size = min(size, 0x1000 - page_offset)
-            result += page[page_offset : page_offset + page_size]
+            page = self.memory.get(page_address, ZERO_PAGE)
+            page_size = min(size, PAGE_SIZE - page_offset)
+            chunks.append(memoryview(page)[page_offset : page_offset + page_size])
             size -= page_size
-            page_address += 0x1000
+            page_address += PAGE_SIZE
             page_offset = 0
 
-        return result
+        return b"".join(chunks)
 
     def modify(self: FakeResolver, size: int, _: int, value: bytes) -> None:
         """Modifies itself in memory."""
-        address = self.resolve_address()
+        address = self.address
         # We store data in the dictionary as 4K pages
-        page_address = address & ~0xFFF
-        page_offset = address & 0xFFF
+        page_address = address & ~PAGE_MASK
+        page_offset = address & PAGE_MASK
+        value = memoryview(value)
 
         while size:
-            page = self.memory.get(page_address, b"\x00" * 0x1000)
-            page_size = min(size, 0x1000 - page_offset)
-            page = page[:page_offset] + value[:page_size] + page[page_offset + page_size :]
-            self.memory[page_address] = page
+            page = self.memory.get(page_address)
+
+            if not isinstance(page, bytearray):
+                # Pages are written in place, so they must be mutable
+                page = bytearray(page) if page is not None else bytearray(PAGE_SIZE)
+                self.memory[page_address] = page
+
+            page_size = min(size, PAGE_SIZE - page_offset)
+            page[page_offset : page_offset + page_size] = value[:page_size]
             size -= page_size
             value = value[page_size:]
-            page_address += 0x1000
+            page_address += PAGE_SIZE
             page_offset = 0
@@ -0,0 +1,127 @@
+#
+# This file is part of libdestruct (https://github.com/mrindeciso/libdestruct).
+# Copyright (c) 2024 Roberto Alessandro Bertolini. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+from weakref import KeyedRef
+
+if TYPE_CHECKING:  # pragma: no cover
+    from libdestruct.common.obj import obj
+
+
+class IdentityMap:
+    """A bounded map from (type, address) pairs to the objects inflated there, so that each one is inflated once.
+
+    The objects are held through weak references, and the least recently used entries are evicted first. Objects
+    which are moved to another address, or whose memory is reused for something else, must be invalidated.
+    """
+
+    max_size: int
+    """The maximum number of entries."""
+
+    def __init__(self: IdentityMap, max_size: int = 0x1000) -> None:
+        """Initialize the identity map.
+
+        Args:
+            max_size: The maximum number of entries.
+        """
+        if max_size <= 0:
+            raise ValueError("The maximum size must be positive.")
+
+        self.max_size = max_size
+        self._entries: OrderedDict[tuple[object, int], KeyedRef] = OrderedDict()
+        self._keys: dict[int, tuple[object, int]] = {}
+
+    def get(self: IdentityMap, item: object, address: int) -> obj | None:
+        """Return the object of the given type inflated at the given address, if it is still alive.
+
+        Args:
+            item: The type, or the inflater, of the object.
+            address: The absolute address of the object.
+        """
+        key = (item, address)
+        entry = self._entries.get(key)
+
+        if entry is None:
+            return None
+
+        value = entry()
+
+        if value is None:
+            self._drop(key)
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def add(self: IdentityMap, item: object, address: int, value: obj) -> None:
+        """Record the object of the given type inflated at the given address.
+
+        Args:
+            item: The type, or the inflater, of the object.
+            address: The absolute address of the object.
+            value: The inflated object.
+        """
+        key = (item, address)
+        self._drop(key)
+
+        # An object is recorded under a single key
+        if id(value) in self._keys:
+            self._drop(self._keys[id(value)])
+
+        def discard(entry: KeyedRef) -> None:
+            # The entry may have been replaced by a newer object in the meantime
+            if self._entries.get(key) is entry:
+                self._drop(key)
+
+        self._entries[key] = KeyedRef(value, discard, id(value))
+        self._keys[id(value)] = key
+
+        while len(self._entries) > self.max_size:
+            self._drop(next(iter(self._entries)))
+
+    def move(self: IdentityMap, value: obj, address: int) -> None:
+        """Record an object under its new address, after it has been rebased.
+
+        Args:
+            value: The rebased object.
+            address: The new absolute address of the object.
+        """
+        key = self._keys.get(id(value))
+
+        # The object may have been evicted, or never recorded at all
+        if key is None or self._entries[key]() is not value:
+            return
+
+        self.add(key[0], address, value)
+
+    def invalidate(self: IdentityMap, address: int | None = None) -> None:
+        """Drop the entries at the given address, or every entry, e.g. after the target has been resumed.
+
+        Args:
+            address: The absolute address of the objects to drop. If not provided, every entry is dropped.
+        """
+        if address is None:
+            self._entries.clear()
+            self._keys.clear()
+            return
+
+        for key in [key for key in self._entries if key[1] == address]:
+            self._drop(key)
+
+    def _drop(self: IdentityMap, key: tuple[object, int]) -> None:
+        """Drop the entry with the given key, if any."""
+        entry = self._entries.pop(key, None)
+
+        # The id of a dead object may have been reused by a newer one
+        if entry is not None and self._keys.get(entry.key) == key:
+            del self._keys[entry.key]
+
+    def __len__(self: IdentityMap) -> int:
+        """Return the number of entries, including those whose object was not collected yet."""
+        return len(self._entries)
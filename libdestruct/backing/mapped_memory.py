@@ -0,0 +1,180 @@
+#
+# This file is part of libdestruct (https://github.com/mrindeciso/libdestruct).
+# Copyright (c) 2024 Roberto Alessandro Bertolini. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+from __future__ import annotations
+
+import mmap
+from bisect import bisect_right
+from operator import itemgetter
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from libdestruct.backing.memory_layer import MemoryLayer
+from libdestruct.backing.memory_map import MemoryMap
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable
+    from os import PathLike
+    from types import TracebackType
+
+    from typing_extensions import Self
+
+
+class MappedMemory(MemoryLayer):
+    """A memory image backed by a memory-mapped file, such as a core dump or a raw memory dump.
+
+    Virtual addresses are translated to file offsets through a segment table, and reads within a segment return
+    memoryview slices of the mapping, so that only the pages which are actually accessed are loaded from the file.
+    """
+
+    segments: list[tuple[int, int, int | None]]
+    """The segment table, as (virtual address, size, file offset) tuples sorted by virtual address.
+
+    Segments with no file offset are not backed by the file, and read as zeroes.
+    """
+
+    def __init__(
+        self: MappedMemory,
+        path: str | PathLike,
+        segments: Iterable[tuple[int, int, int | None]] | None = None,
+        base_address: int = 0,
+        writable: bool = False,
+    ) -> None:
+        """Map a file in memory.
+
+        Args:
+            path: The path of the file to map.
+            segments: The segment table, as (virtual address, size, file offset) tuples. A file offset of None marks a
+                zero-filled segment. If not provided, the whole file is mapped starting at the base address.
+            base_address: The virtual address of the start of the file, used only if no segments are provided.
+            writable: Whether writes are allowed. Writes are copy-on-write and are never written back to the file.
+        """
+        with Path(path).open("rb") as file:
+            size = Path(path).stat().st_size
+
+            if not size:
+                raise ValueError("Cannot map an empty file.")
+
+            self.memory = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY if writable else mmap.ACCESS_READ)
+
+        self._view = memoryview(self.memory)
+        self.writable = writable
+
+        self._set_segments([(base_address, size, 0)] if segments is None else segments)
+
+    def _set_segments(self: MappedMemory, segments: Iterable[tuple[int, int, int | None]]) -> None:
+        """Validate and index the segment table."""
+        self.segments = sorted(segments, key=itemgetter(0))
+
+        for address, size, file_offset in self.segments:
+            if file_offset is not None and file_offset + size > len(self.memory):
+                raise ValueError(f"Segment at 0x{address:x} exceeds the size of the file.")
+
+        self._segment_starts = [address for address, _, _ in self.segments]
+
+        permissions = "rw-p" if self.writable else "r--p"
+        self._memory_map = MemoryMap((address, address + size, permissions, "") for address, size, _ in self.segments)
+
+    @property
+    def memory_map(self: MappedMemory) -> MemoryMap:
+        """The map of the segments of the memory image."""
+        return self._memory_map
+
+    def translate(self: MappedMemory, address: int, size: int = 1) -> int:
+        """Translate a virtual address range into an offset in the file.
+
+        Args:
+            address: The virtual address.
+            size: The size of the range, which must be entirely contained in one file-backed segment.
+        """
+        index = bisect_right(self._segment_starts, address) - 1
+
+        if index >= 0:
+            start, segment_size, file_offset = self.segments[index]
+
+            if file_offset is not None and address + size <= start + segment_size:
+                return file_offset + address - start
+
+        raise IndexError(f"Address range 0x{address:x}-0x{address + size:x} is not mapped.")
+
+    def read(self: MappedMemory, address: int, size: int) -> memoryview | bytes:
+        """Return the content of the given range.
+
+        Ranges contained in a single file-backed segment are returned as zero-copy views of the mapping.
+
+        Args:
+            address: The start address of the range.
+            size: The size of the range.
+        """
+        index = bisect_right(self._segment_starts, address) - 1
+
+        if index >= 0:
+            start, segment_size, file_offset = self.segments[index]
+
+            if file_offset is not None and address + size <= start + segment_size:
+                offset = file_offset + address - start
+                return self._view[offset : offset + size]
+
+        return self._read_spanning(index, address, size)
+
+    def _read_spanning(self: MappedMemory, index: int, address: int, size: int) -> bytes:
+        """Read a range spanning several contiguous segments, or zero-filled ones."""
+        end = address + size
+        chunks = []
+        current = address
+
+        while current < end:
+            if index < 0 or index >= len(self.segments):
+                raise IndexError(f"Address 0x{current:x} is not mapped.")
+
+            start, segment_size, file_offset = self.segments[index]
+
+            if not start <= current < start + segment_size:
+                raise IndexError(f"Address 0x{current:x} is not mapped.")
+
+            chunk_size = min(end, start + segment_size) - current
+
+            if file_offset is None:
+                chunks.append(bytes(chunk_size))
+            else:
+                offset = file_offset + current - start
+                chunks.append(self._view[offset : offset + chunk_size])
+
+            current += chunk_size
+            index += 1
+
+        return b"".join(chunks)
+
+    def write(self: MappedMemory, address: int, value: bytes) -> None:
+        """Write the given value at the given address.
+
+        Args:
+            address: The start address of the range.
+            value: The bytes to write.
+        """
+        if not self.writable:
+            raise ValueError("The memory image is not writable.")
+
+        offset = self.translate(address, len(value))
+        self._view[offset : offset + len(value)] = value
+
+    def close(self: MappedMemory) -> None:
+        """Unmap the file. Views returned by previous reads must have been released."""
+        self._view.release()
+        self.memory.close()
+
+    def __enter__(self: MappedMemory) -> Self:
+        """Return the memory image."""
+        return self
+
+    def __exit__(
+        self: MappedMemory,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Unmap the file."""
+        self.close()
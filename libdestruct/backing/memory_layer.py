@@ -0,0 +1,87 @@
+#
+# This file is part of libdestruct (https://github.com/mrindeciso/libdestruct).
+# Copyright (c) 2024 Roberto Alessandro Bertolini. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+from __future__ import annotations
+
+from abc import abstractmethod
+from collections.abc import MutableSequence
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from libdestruct.backing.memory_map import MemoryMap
+
+
+class MemoryLayer(MutableSequence):
+    """A memory storage, or a layer over one, which can be passed to `inflater()` as the backing memory.
+
+    Every resolver derived from the inflater shares the layer, so that members and pointer targets go through it.
+    """
+
+    memory: MutableSequence
+    """The backing memory storage."""
+
+    @property
+    def memory_map(self: MemoryLayer) -> MemoryMap | None:
+        """The map of the valid regions of the memory, if known."""
+        return self.memory.memory_map if isinstance(self.memory, MemoryLayer) else None
+
+    @abstractmethod
+    def read(self: MemoryLayer, address: int, size: int) -> bytes:
+        """Read the given range.
+
+        Args:
+            address: The start address of the range.
+            size: The size of the range.
+        """
+
+    @abstractmethod
+    def write(self: MemoryLayer, address: int, value: bytes) -> None:
+        """Write the given value at the given address.
+
+        Args:
+            address: The start address of the range.
+            value: The bytes to write.
+        """
+
+    def read_many(self: MemoryLayer, ranges: list[tuple[int, int]]) -> list[bytes]:
+        """Read several ranges at once.
+
+        Args:
+            ranges: The (address, size) pairs to read.
+        """
+        return [self.read(address, size) for address, size in ranges]
+
+    def __getitem__(self: MemoryLayer, key: int | slice) -> int | bytes:
+        """Read a single byte or a range of bytes."""
+        if isinstance(key, slice):
+            if key.step not in (None, 1):
+                raise ValueError(f"Only contiguous ranges can be read through {self.__class__.__name__}.")
+
+            return self.read(key.start, max(key.stop - key.start, 0))
+
+        return self.read(key, 1)[0]
+
+    def __setitem__(self: MemoryLayer, key: int | slice, value: int | bytes) -> None:
+        """Write a single byte or a range of bytes."""
+        if isinstance(key, slice):
+            if key.step not in (None, 1):
+                raise ValueError(f"Only contiguous ranges can be written through {self.__class__.__name__}.")
+
+            self.write(key.start, value)
+        else:
+            self.write(key, bytes([value]))
+
+    def __delitem__(self: MemoryLayer, key: int | slice) -> None:
+        """Memory layers don't support deletion."""
+        raise NotImplementedError(f"{self.__class__.__name__} doesn't support deletion.")
+
+    def __len__(self: MemoryLayer) -> int:
+        """Return the size of the backing memory."""
+        return len(self.memory)
+
+    def insert(self: MemoryLayer, index: int, value: int) -> None:
+        """Memory layers don't support insertion."""
+        raise NotImplementedError(f"{self.__class__.__name__} doesn't support insertion.")
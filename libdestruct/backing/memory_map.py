@@ -0,0 +1,127 @@
+#
+# This file is part of libdestruct (https://github.com/mrindeciso/libdestruct).
+# Copyright (c) 2024 Roberto Alessandro Bertolini. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Callable, Iterable
+
+
+class MemoryMap:
+    """An index of the mapped memory regions of a target, used to validate addresses without touching memory."""
+
+    regions: list[tuple[int, int, str, str]]
+    """The mapped regions, as (start, end, permissions, path) tuples sorted by start address."""
+
+    def __init__(
+        self: MemoryMap,
+        regions: Iterable[tuple[int, int, str, str]],
+        source: Callable[[], Iterable[tuple[int, int, str, str]]] | None = None,
+    ) -> None:
+        """Initialize the memory map.
+
+        Args:
+            regions: The mapped regions, as (start, end, permissions, path) tuples. Permissions use the /proc/pid/maps
+                notation, e.g. "rw-p".
+            source: A callable returning the current regions, used by `refresh()`.
+        """
+        self._source = source
+        self._set_regions(regions)
+
+    @classmethod
+    def from_pid(cls: type[MemoryMap], pid: int) -> MemoryMap:
+        """Build the memory map of a live process from /proc/pid/maps.
+
+        Args:
+            pid: The process ID of the target process.
+        """
+
+        def source() -> list[tuple[int, int, str, str]]:
+            return parse_proc_maps(Path(f"/proc/{pid}/maps").read_text())
+
+        return cls(source(), source)
+
+    def _set_regions(self: MemoryMap, regions: Iterable[tuple[int, int, str, str]]) -> None:
+        """Sort and index the regions."""
+        self.regions = sorted(regions)
+        self._starts = [start for start, _, _, _ in self.regions]
+
+    def refresh(self: MemoryMap) -> None:
+        """Reload the regions from their source, e.g. after the target has mapped or unmapped memory."""
+        if self._source is None:
+            raise RuntimeError("The memory map has no source to be refreshed from.")
+
+        self._set_regions(self._source())
+
+    def region_for(self: MemoryMap, address: int) -> tuple[int, int, str, str] | None:
+        """Return the region containing the given address, if any.
+
+        Args:
+            address: The address to look up.
+        """
+        index = bisect_right(self._starts, address) - 1
+
+        if index >= 0 and address < self.regions[index][1]:
+            return self.regions[index]
+
+        return None
+
+    def is_mapped(self: MemoryMap, address: int, size: int = 1, permissions: str = "r") -> bool:
+        """Return whether the given range is entirely mapped with the given permissions.
+
+        Args:
+            address: The start address of the range.
+            size: The size of the range.
+            permissions: The permissions every region in the range must have, e.g. "r" or "rw".
+        """
+        index = bisect_right(self._starts, address) - 1
+        end = address + max(size, 1)
+
+        # The range may span several contiguous regions
+        while index >= 0 and index < len(self.regions):
+            start, region_end, region_permissions, _ = self.regions[index]
+
+            if not start <= address < region_end:
+                return False
+
+            if any(permission not in region_permissions for permission in permissions):
+                return False
+
+            if end <= region_end:
+                return True
+
+            address = region_end
+            index += 1
+
+        return False
+
+    def __contains__(self: MemoryMap, address: int) -> bool:
+        """Return whether the given address is mapped."""
+        return self.region_for(address) is not None
+
+
+def parse_proc_maps(content: str) -> list[tuple[int, int, str, str]]:
+    """Parse the content of a /proc/pid/maps file into (start, end, permissions, path) tuples.
+
+    Args:
+        content: The content of the file.
+    """
+    regions = []
+
+    for line in content.splitlines():
+        if not line.strip():
+            continue
+
+        # The path is missing for anonymous mappings
+        address_range, permissions, _, _, _, *path = line.split(maxsplit=5)
+        start, end = (int(value, 16) for value in address_range.split("-"))
+        regions.append((start, end, permissions, path[0] if path else ""))
+
+    return regions
@@ -6,48 +6,112 @@
 
 from __future__ import annotations
 
+from mmap import mmap
 from typing import TYPE_CHECKING
 
+from libdestruct.backing.memory_layer import MemoryLayer
 from libdestruct.backing.resolver import Resolver
 
 if TYPE_CHECKING:  # pragma: no cover
-    from collections.abc import MutableSequence
+    from collections.abc import Iterable, MutableSequence
+
+    from libdestruct.backing.identity_map import IdentityMap
+    from libdestruct.backing.memory_map import MemoryMap
 
 
 class MemoryResolver(Resolver):
     """A class that can resolve itself to a value in a referenced memory storage."""
 
-    def __init__(self: MemoryResolver, memory: MutableSequence, address: int | None) -> MemoryResolver:
+    def __init__(
+        self: MemoryResolver,
+        memory: MutableSequence,
+        address: int | None,
+        memory_map: MemoryMap | None = None,
+        identity_map: IdentityMap | None = None,
+    ) -> MemoryResolver:
         """Initializes a basic memory resolver."""
         self.memory = memory
         self.address = address
         self.parent = None
         self.offset = None
+        self.memory_map = memory_map
+        self.identity_map = identity_map
 
     def resolve_address(self: MemoryResolver) -> int:
         """Resolves self's address, mainly used by childs to determine their own address."""
-        if self.address is not None:
-            return self.address
-
-        return self.parent.resolve_address() + self.offset
+        return self.address
 
     def relative_from_own(self: MemoryResolver, address_offset: int, _: int) -> MemoryResolver:
-        """Creates a resolver that references a parent, such that a change in the parent is propagated on the child."""
-        new_resolver = MemoryResolver(self.memory, None)
+        """Creates a resolver at an offset from its parent, which caches its address until `invalidate()` is called."""
+        # The absolute address is computed once here, so that no parent chain has to be walked on access
+        new_resolver = MemoryResolver(self.memory, self.address + address_offset, self.memory_map, self.identity_map)
         new_resolver.parent = self
         new_resolver.offset = address_offset
         return new_resolver
 
     def absolute_from_own(self: Resolver, address: int) -> MemoryResolver:
         """Creates a resolver that has an absolute reference to an object, from the parent's view."""
-        return MemoryResolver(self.memory, address)
+        return MemoryResolver(self.memory, address, self.memory_map, self.identity_map)
 
     def resolve(self: MemoryResolver, size: int, _: int) -> bytes:
         """Resolves itself, providing the bytes it references for the specified size and index."""
-        address = self.resolve_address()
+        address = self.address
+        return self.memory[address : address + size]
+
+    def resolve_view(self: MemoryResolver, size: int) -> memoryview | bytes:
+        """Resolves itself, as a zero-copy view of the backing memory if it exposes the buffer protocol.
+
+        Args:
+            size: The size of the referenced range.
+        """
+        address = self.address
+
+        if isinstance(self.memory, bytes | bytearray | memoryview | mmap):
+            return memoryview(self.memory)[address : address + size]
+
         return self.memory[address : address + size]
 
     def modify(self: Resolver, size: int, _: int, value: bytes) -> None:
         """Modifies itself in memory."""
-        address = self.resolve_address()
+        address = self.address
         self.memory[address : address + size] = value
+
+    def resolve_many(self: MemoryResolver, ranges: Iterable[tuple[int, int]]) -> list[bytes]:
+        """Resolves several absolute ranges at once, reading overlapping and adjacent ranges together.
+
+        Args:
+            ranges: The (address, size) pairs to resolve.
+
+        Returns:
+            The bytes referenced by each range, in the same order as the ranges.
+        """
+        ranges = list(ranges)
+        order = sorted(range(len(ranges)), key=lambda index: ranges[index][0])
+
+        # Merge the sorted ranges into the minimal set of contiguous reads
+        merged = []
+        owner = [0] * len(ranges)
+
+        for index in order:
+            address, size = ranges[index]
+
+            if merged and address <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], address + size)
+            else:
+                merged.append([address, address + size])
+
+            owner[index] = len(merged) - 1
+
+        if isinstance(self.memory, MemoryLayer):
+            # Memory layers may serve all the reads at once, e.g. with vectored I/O
+            chunks = self.memory.read_many([(start, end - start) for start, end in merged])
+        else:
+            chunks = [self.memory[start:end] for start, end in merged]
+
+        results = []
+
+        for index, (address, size) in enumerate(ranges):
+            start = merged[owner[index]][0]
+            results.append(chunks[owner[index]][address - start : address - start + size])
+
+        return results
@@ -0,0 +1,151 @@
+#
+# This file is part of libdestruct (https://github.com/mrindeciso/libdestruct).
+# Copyright (c) 2024 Roberto Alessandro Bertolini. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from libdestruct.backing.memory_layer import MemoryLayer
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import MutableSequence
+
+
+class PageCache(MemoryLayer):
+    """A read-through cache over a memory storage, which fetches whole pages on first access.
+
+    Writes go through to the backing memory and update the cached pages.
+    """
+
+    page_size: int
+    """The size of a cached page, in bytes."""
+
+    generation: int
+    """The generation of the cached pages, incremented on every invalidation."""
+
+    def __init__(self: PageCache, memory: MutableSequence, page_size: int = 0x1000) -> None:
+        """Initialize the page cache.
+
+        Args:
+            memory: The backing memory storage.
+            page_size: The size of a cached page, in bytes. Must be a power of 2.
+        """
+        if page_size <= 0 or page_size & (page_size - 1):
+            raise ValueError("The page size must be a power of 2.")
+
+        self.memory = memory
+        self.page_size = page_size
+        self.generation = 0
+        self._pages: dict[int, bytearray] = {}
+
+    def invalidate(self: PageCache) -> None:
+        """Drop every cached page and start a new generation, e.g. after the target has been resumed."""
+        self._pages.clear()
+        self.generation += 1
+
+    def _page(self: PageCache, page_address: int) -> bytearray:
+        """Return the cached page at the given address, fetching it from the backing memory if needed."""
+        page = self._pages.get(page_address)
+
+        if page is None:
+            page = bytearray(self._fetch(page_address))
+            self._pages[page_address] = page
+
+        return page
+
+    def _fetch(self: PageCache, page_address: int) -> bytes:
+        """Read a page from the backing memory, clipped to the end of its mapped range if it runs past it."""
+        page_end = page_address + self.page_size
+
+        try:
+            return self.memory[page_address:page_end]
+        except (IndexError, ValueError):
+            # Backends such as memory images raise on reads past their end, instead of returning less data
+            memory_map = self.memory_map
+
+            if memory_map is None:
+                raise
+
+        end = page_address
+
+        while end < page_end and (region := memory_map.region_for(end)) is not None:
+            end = region[1]
+
+        if end == page_address:
+            raise IndexError(f"Address 0x{page_address:x} is not mapped.")
+
+        return self.memory[page_address : min(end, page_end)]
+
+    def read(self: PageCache, address: int, size: int) -> bytes:
+        """Read the given range, fetching the pages it spans that are not cached yet.
+
+        Args:
+            address: The start address of the range.
+            size: The size of the range.
+        """
+        page_mask = self.page_size - 1
+        page_address = address & ~page_mask
+        page_offset = address & page_mask
+
+        try:
+            result = self._read_pages(page_address, page_offset, size)
+        except (IndexError, ValueError):
+            # The page is not entirely mapped, e.g. a segment starts in its middle, so we bypass the cache
+            return bytes(self.memory[address : address + size])
+
+        if len(result) < size:
+            # The range runs past the end of a clipped page, and the backing memory decides how to handle it
+            return bytes(self.memory[address : address + size])
+
+        return result
+
+    def _read_pages(self: PageCache, page_address: int, page_offset: int, size: int) -> bytes:
+        """Read a range from the cached pages, starting at the given offset of the given page."""
+        # Fast path: the range is contained in a single page
+        if page_offset + size <= self.page_size:
+            return bytes(memoryview(self._page(page_address))[page_offset : page_offset + size])
+
+        chunks = []
+
+        while size > 0:
+            page = self._page(page_address)
+            chunk = memoryview(page)[page_offset : page_offset + size]
+            chunks.append(chunk)
+            size -= len(chunk)
+
+            if len(page) < self.page_size:
+                # The backing memory ended within this page
+                break
+
+            page_address += self.page_size
+            page_offset = 0
+
+        return b"".join(chunks)
+
+    def write(self: PageCache, address: int, value: bytes) -> None:
+        """Write the given value to the backing memory, updating the cached pages it spans.
+
+        Args:
+            address: The start address of the range.
+            value: The bytes to write.
+        """
+        self.memory[address : address + len(value)] = bytes(value)
+
+        page_mask = self.page_size - 1
+        page_address = address & ~page_mask
+        page_offset = address & page_mask
+        value = memoryview(value)
+
+        while value:
+            chunk_size = min(len(value), self.page_size - page_offset)
+            page = self._pages.get(page_address)
+
+            if page is not None:
+                page[page_offset : page_offset + chunk_size] = value[:chunk_size]
+
+            value = value[chunk_size:]
+            page_address += self.page_size
+            page_offset = 0
@@ -0,0 +1,153 @@
+#
+# This file is part of libdestruct (https://github.com/mrindeciso/libdestruct).
+# Copyright (c) 2024 Roberto Alessandro Bertolini. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+from __future__ import annotations
+
+import ctypes
+import errno
+import os
+
+from libdestruct.backing.memory_layer import MemoryLayer
+from libdestruct.backing.memory_map import MemoryMap
+
+IOV_MAX = 1024
+"""The maximum number of iovec structures that can be passed to a single system call."""
+
+
+class iovec(ctypes.Structure):
+    """The iovec structure used by vectored I/O system calls."""
+
+    _fields_ = (("iov_base", ctypes.c_void_p), ("iov_len", ctypes.c_size_t))
+
+
+libc = ctypes.CDLL(None, use_errno=True)
+
+process_vm_readv = libc.process_vm_readv
+process_vm_readv.argtypes = (
+    ctypes.c_int,
+    ctypes.POINTER(iovec),
+    ctypes.c_ulong,
+    ctypes.POINTER(iovec),
+    ctypes.c_ulong,
+    ctypes.c_ulong,
+)
+process_vm_readv.restype = ctypes.c_ssize_t
+
+process_vm_writev = libc.process_vm_writev
+process_vm_writev.argtypes = process_vm_readv.argtypes
+process_vm_writev.restype = ctypes.c_ssize_t
+
+
+class ProcessMemory(MemoryLayer):
+    """The memory of a live process, accessed with process_vm_readv and process_vm_writev.
+
+    The target doesn't have to be stopped or traced, but writes are subject to the protection of the target pages,
+    so read-only mappings cannot be written.
+    """
+
+    pid: int
+    """The process ID of the target process."""
+
+    def __init__(self: ProcessMemory, pid: int) -> None:
+        """Initialize the memory of a live process.
+
+        Args:
+            pid: The process ID of the target process.
+        """
+        self.pid = pid
+        self._memory_map = None
+
+    @property
+    def memory_map(self: ProcessMemory) -> MemoryMap:
+        """The map of the target process, parsed from /proc/pid/maps on first access."""
+        if self._memory_map is None:
+            self._memory_map = MemoryMap.from_pid(self.pid)
+
+        return self._memory_map
+
+    def read(self: ProcessMemory, address: int, size: int) -> bytes:
+        """Read the given range from the target process.
+
+        Args:
+            address: The start address of the range.
+            size: The size of the range.
+        """
+        return self.read_many([(address, size)])[0]
+
+    def read_many(self: ProcessMemory, ranges: list[tuple[int, int]]) -> list[bytes]:
+        """Read several ranges from the target process, with one system call for up to IOV_MAX ranges.
+
+        Args:
+            ranges: The (address, size) pairs to read.
+        """
+        results = []
+
+        for batch_start in range(0, len(ranges), IOV_MAX):
+            batch = ranges[batch_start : batch_start + IOV_MAX]
+            total = sum(size for _, size in batch)
+            buffer = ctypes.create_string_buffer(total)
+            local, remote = self._iovecs(batch, ctypes.addressof(buffer))
+
+            self._check(process_vm_readv(self.pid, local, len(batch), remote, len(batch), 0), batch, total)
+
+            data = buffer.raw
+            offset = 0
+
+            for _, size in batch:
+                results.append(data[offset : offset + size])
+                offset += size
+
+        return results
+
+    def write(self: ProcessMemory, address: int, value: bytes) -> None:
+        """Write the given value to the target process.
+
+        Args:
+            address: The start address of the range.
+            value: The bytes to write.
+        """
+        buffer = ctypes.create_string_buffer(bytes(value), len(value))
+        local, remote = self._iovecs([(address, len(value))], ctypes.addressof(buffer))
+
+        self._check(process_vm_writev(self.pid, local, 1, remote, 1, 0), [(address, len(value))], len(value))
+
+    @staticmethod
+    def _iovecs(ranges: list[tuple[int, int]], local_base: int) -> tuple[ctypes.Array, ctypes.Array]:
+        """Build the local and remote iovec arrays for the given ranges, packed in a local buffer."""
+        local = (iovec * len(ranges))()
+        remote = (iovec * len(ranges))()
+        offset = 0
+
+        for index, (address, size) in enumerate(ranges):
+            local[index].iov_base = local_base + offset
+            local[index].iov_len = size
+            remote[index].iov_base = address
+            remote[index].iov_len = size
+            offset += size
+
+        return local, remote
+
+    def _check(self: ProcessMemory, result: int, ranges: list[tuple[int, int]], total: int) -> None:
+        """Raise an exception if a vectored transfer failed or was partial."""
+        if result < 0:
+            error = ctypes.get_errno()
+
+            if error == errno.EFAULT:
+                raise ValueError(f"Invalid address in the range starting at 0x{ranges[0][0]:x}.")
+
+            raise OSError(error, os.strerror(error))
+
+        if result < total:
+            # The transfer stops at the first range that could not be accessed
+            for address, size in ranges:
+                if result < size:
+                    raise ValueError(f"Invalid address 0x{address + result:x}.")
+
+                result -= size
+
+    def __len__(self: ProcessMemory) -> int:
+        """The memory of a process doesn't have a length."""
+        raise NotImplementedError("ProcessMemory doesn't support length.")
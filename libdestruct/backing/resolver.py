@@ -7,18 +7,41 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
 
 from typing_extensions import Self
 
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable
+
+    from libdestruct.backing.identity_map import IdentityMap
+    from libdestruct.backing.memory_map import MemoryMap
+
+PAGE_SIZE = 0x1000
+"""The size of a memory page, which bounds the chunks read when scanning for the terminator of a string."""
+
 
 class Resolver(ABC):
     """A class that can resolve itself to a value, either in memory or in other storage types."""
 
     parent: Self
+    """The parent resolver, if this resolver is relative to another one."""
+
+    offset: int | None
+    """The offset of this resolver from its parent, if any."""
+
+    address: int | None
+    """The cached absolute address of this resolver."""
+
+    memory_map: MemoryMap | None = None
+    """The map of the valid regions of the backing storage, if known."""
+
+    identity_map: IdentityMap | None = None
+    """The map of the objects already inflated from the backing storage, if any."""
 
     @abstractmethod
     def relative_from_own(self: Resolver, address_offset: int, index_offset: int) -> Self:
-        """Creates a resolver that references a parent, such that a change in the parent is propagated on the child."""
+        """Creates a resolver at an offset from its parent, which caches its address until `invalidate()` is called."""
 
     @abstractmethod
     def absolute_from_own(self: Resolver, address: int) -> Self:
@@ -35,3 +58,157 @@ class Resolver(ABC):
     @abstractmethod
     def modify(self: Resolver, size: int, index: int, value: bytes) -> None:
         """Modifies itself."""
+
+    def resolve_view(self: Resolver, size: int) -> memoryview | bytes:
+        """Resolves itself, as a zero-copy view of the backing memory if possible, or as a copy otherwise.
+
+        Args:
+            size: The size of the referenced range.
+        """
+        return self.resolve(size, 0)
+
+    def resolve_many(self: Resolver, ranges: Iterable[tuple[int, int]]) -> list[bytes]:
+        """Resolves several absolute ranges at once, from the view of this resolver.
+
+        Args:
+            ranges: The (address, size) pairs to resolve.
+
+        Returns:
+            The bytes referenced by each range, in the same order as the ranges.
+        """
+        return [self.absolute_from_own(address).resolve(size, 0) for address, size in ranges]
+
+    def try_resolve_many(self: Resolver, ranges: Iterable[tuple[int, int]]) -> list[bytes | None]:
+        """Resolves several absolute ranges at once, or one by one if the batched read fails.
+
+        Args:
+            ranges: The (address, size) pairs to resolve.
+
+        Returns:
+            The bytes referenced by each range, in the same order as the ranges, or None for the ranges which cannot
+            be read, so that an invalid range does not fail the others.
+        """
+        ranges = list(ranges)
+
+        try:
+            return self.resolve_many(ranges)
+        except (IndexError, ValueError):
+            return [self._try_resolve(address, size) for address, size in ranges]
+
+    def _try_resolve(self: Resolver, address: int, size: int) -> bytes | None:
+        """Resolves an absolute range, or returns None if it cannot be read."""
+        try:
+            return self.absolute_from_own(address).resolve(size, 0)
+        except (IndexError, ValueError):
+            return None
+
+    def resolve_readable(self: Resolver, address: int, size: int) -> bytes:
+        """Resolves an absolute range from the view of this resolver, shortened if it runs past the readable memory.
+
+        The range is clipped to its mapped region if the memory map is known, and a read which fails is retried with a
+        shorter one, since backends such as memory images raise on reads past their end.
+
+        Args:
+            address: The absolute address of the range.
+            size: The maximum size of the range.
+        """
+        size = self._readable_size(address, size)
+
+        if not size:
+            return b""
+
+        try:
+            return bytes(self.absolute_from_own(address).resolve(size, 0))
+        except (IndexError, ValueError):
+            return self.resolve_readable(address, size // 2)
+
+    def _readable_size(self: Resolver, address: int, size: int) -> int:
+        """Return the size of the range, clipped to the end of its mapped region if the memory map is known."""
+        if self.memory_map is None:
+            return size
+
+        region = self.memory_map.region_for(address)
+        return 0 if region is None else min(size, region[1] - address)
+
+    def resolve_strings(
+        self: Resolver,
+        addresses: Iterable[int],
+        max_length: int | None = None,
+    ) -> list[bytes | None]:
+        """Resolves several NUL-terminated strings at once, from the view of this resolver.
+
+        The strings are fetched in rounds of batched reads through `resolve_many`, each reaching the end of the page
+        or of the mapped region, and a string which does not end there is continued in the following round. Ranges
+        which cannot be read, even one by one, are read again shortened, so that an invalid string does not fail
+        the others.
+
+        Args:
+            addresses: The absolute addresses of the strings.
+            max_length: The maximum length of each string, beyond which it is truncated.
+
+        Returns:
+            The content of each string, without the terminator, in the same order as the addresses. Strings which run
+            into unreadable memory before their terminator are None.
+        """
+        cursors = list(addresses)
+        parts: list[list[bytes] | None] = [[] for _ in cursors]
+        lengths = [0] * len(cursors)
+        pending = [index for index in range(len(cursors)) if max_length != 0]
+
+        while pending:
+            ranges = [
+                (cursors[index], self._readable_size(cursors[index], PAGE_SIZE - cursors[index] % PAGE_SIZE))
+                for index in pending
+            ]
+
+            contents = [
+                self.resolve_readable(address, size) if content is None else content
+                for (address, size), content in zip(ranges, self.try_resolve_many(ranges), strict=True)
+            ]
+
+            still_pending = []
+
+            for index, content in zip(pending, contents, strict=True):
+                chunk = bytes(content)
+
+                if max_length is not None:
+                    chunk = chunk[: max_length - lengths[index]]
+
+                terminator = chunk.find(b"\x00")
+
+                if terminator != -1:
+                    parts[index].append(chunk[:terminator])
+                    continue
+
+                if not chunk:
+                    # The readable memory ended before the terminator
+                    parts[index] = None
+                    continue
+
+                parts[index].append(chunk)
+                lengths[index] += len(chunk)
+
+                if max_length is None or lengths[index] < max_length:
+                    cursors[index] += len(chunk)
+                    still_pending.append(index)
+
+            pending = still_pending
+
+        return [None if chunks is None else b"".join(chunks) for chunks in parts]
+
+    def rebase(self: Resolver, address: int) -> None:
+        """Moves the resolver to a new absolute address, detaching it from its parent.
+
+        Children of this resolver keep their old cached address until they are invalidated.
+
+        Args:
+            address: The new absolute address.
+        """
+        self.address = address
+        self.parent = None
+        self.offset = None
+
+    def invalidate(self: Resolver) -> None:
+        """Recomputes the cached address from the parent, after the parent has been moved."""
+        if self.parent is not None:
+            self.address = self.parent.resolve_address() + self.offset
@@ -0,0 +1,142 @@
+#
+# This file is part of libdestruct (https://github.com/mrindeciso/libdestruct).
+# Copyright (c) 2024 Roberto Alessandro Bertolini. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from typing import TYPE_CHECKING
+
+from libdestruct.backing.memory_layer import MemoryLayer
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import MutableSequence
+    from types import TracebackType
+
+    from typing_extensions import Self
+
+
+class WriteBuffer(MemoryLayer):
+    """A write-back buffer over a memory storage, which coalesces writes into contiguous ranges.
+
+    Writes are kept pending until `flush()` is called, and are merged with any overlapping or adjacent pending write.
+    Reads see the pending writes. When used as a context manager, the pending writes are flushed on exit, or discarded
+    if an exception was raised.
+    """
+
+    def __init__(self: WriteBuffer, memory: MutableSequence) -> None:
+        """Initialize the write buffer.
+
+        Args:
+            memory: The backing memory storage.
+        """
+        self.memory = memory
+
+        # The pending ranges are kept sorted by start address, and never overlap nor touch each other
+        self._starts: list[int] = []
+        self._ranges: list[bytearray] = []
+
+    @property
+    def pending(self: WriteBuffer) -> list[tuple[int, int]]:
+        """The pending ranges, as (address, size) pairs sorted by address."""
+        return [(start, len(data)) for start, data in zip(self._starts, self._ranges, strict=True)]
+
+    def read(self: WriteBuffer, address: int, size: int) -> bytes:
+        """Read the given range, overlaid with the pending writes.
+
+        Args:
+            address: The start address of the range.
+            size: The size of the range.
+        """
+        end = address + size
+        first = max(bisect_right(self._starts, address) - 1, 0)
+        last = bisect_left(self._starts, end)
+
+        # Fast path: the range is entirely pending, so we don't have to touch the backing memory
+        if first < last and self._starts[first] <= address and self._starts[first] + len(self._ranges[first]) >= end:
+            start = self._starts[first]
+            return bytes(self._ranges[first][address - start : end - start])
+
+        result = bytearray(self.memory[address:end])
+
+        for start, data in zip(self._starts[first:last], self._ranges[first:last], strict=True):
+            # Clip the pending range to the requested one
+            overlay_start = max(start, address)
+            overlay_end = min(start + len(data), address + len(result))
+
+            if overlay_start < overlay_end:
+                result[overlay_start - address : overlay_end - address] = data[
+                    overlay_start - start : overlay_end - start
+                ]
+
+        return bytes(result)
+
+    def write(self: WriteBuffer, address: int, value: bytes) -> None:
+        """Buffer a write, merging it with the pending ranges it overlaps or touches.
+
+        Args:
+            address: The start address of the range.
+            value: The bytes to write.
+        """
+        end = address + len(value)
+
+        # Find the pending ranges that overlap or touch [address, end]
+        first = bisect_right(self._starts, address) - 1
+        if first < 0 or self._starts[first] + len(self._ranges[first]) < address:
+            first += 1
+        last = bisect_right(self._starts, end)
+
+        if first == last:
+            self._starts.insert(first, address)
+            self._ranges.insert(first, bytearray(value))
+            return
+
+        merged_start = min(self._starts[first], address)
+        merged_end = max(self._starts[last - 1] + len(self._ranges[last - 1]), end)
+
+        if first == last - 1 and merged_start == self._starts[first] and merged_end == self._starts[first] + len(
+            self._ranges[first],
+        ):
+            # The write falls entirely within a single pending range
+            self._ranges[first][address - merged_start : end - merged_start] = value
+            return
+
+        merged = bytearray(merged_end - merged_start)
+
+        for start, data in zip(self._starts[first:last], self._ranges[first:last], strict=True):
+            merged[start - merged_start : start - merged_start + len(data)] = data
+
+        merged[address - merged_start : end - merged_start] = value
+
+        self._starts[first:last] = [merged_start]
+        self._ranges[first:last] = [merged]
+
+    def flush(self: WriteBuffer) -> None:
+        """Write every pending range to the backing memory, with one write per contiguous range."""
+        for start, data in zip(self._starts, self._ranges, strict=True):
+            self.memory[start : start + len(data)] = bytes(data)
+
+        self.discard()
+
+    def discard(self: WriteBuffer) -> None:
+        """Drop every pending write, rolling back to the content of the backing memory."""
+        self._starts.clear()
+        self._ranges.clear()
+
+    def __enter__(self: WriteBuffer) -> Self:
+        """Start buffering writes."""
+        return self
+
+    def __exit__(
+        self: WriteBuffer,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Flush the pending writes, or discard them if an exception was raised."""
+        if exc_type is None:
+            self.flush()
+        else:
+            self.discard()
@@ -0,0 +1,50 @@
+#
+# This file is part of libdestruct (https://github.com/mrindeciso/libdestruct).
+# Copyright (c) 2024 Roberto Alessandro Bertolini. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+from __future__ import annotations
+
+from libdestruct.c.c_integer_types import _c_integer
+from libdestruct.c.ctypes_generic import _ctypes_generic
+from libdestruct.common.codec import Codec, CodecRegistry, PrimitiveCodec
+from libdestruct.common.codec.codec import integer_format
+
+registry = CodecRegistry()
+
+CTYPES_INTEGER_CODES = "bBhHiIlLqQ"
+"""The ctypes type codes of the integer types."""
+
+CTYPES_FORMATS = "fd?c"
+"""The ctypes type codes which are also valid struct format characters."""
+
+
+def integer_codec(item: type[_c_integer]) -> Codec | None:
+    """Return the codec for a C integer type."""
+    size = getattr(item, "size", None)
+    format_char = integer_format(size, item.signed) if size else None
+
+    return PrimitiveCodec(format_char, size) if format_char else None
+
+
+def ctypes_codec(item: type[_ctypes_generic]) -> Codec | None:
+    """Return the codec for a ctypes type, if it maps to a struct format character."""
+    type_code = getattr(getattr(item, "backing_type", None), "_type_", None)
+
+    if not isinstance(type_code, str) or len(type_code) != 1:
+        return None
+
+    if type_code in CTYPES_FORMATS:
+        return PrimitiveCodec(type_code, item.size)
+
+    if type_code in CTYPES_INTEGER_CODES:
+        # ctypes codes use native sizes, so we map them by size instead
+        format_char = integer_format(item.size, type_code.islower())
+        return PrimitiveCodec(format_char, item.size) if format_char else None
+
+    return None
+
+
+registry.register_type_handler(_c_integer, integer_codec)
+registry.register_type_handler(_ctypes_generic, ctypes_codec)
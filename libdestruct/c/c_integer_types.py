@@ -30,7 +30,7 @@ class _c_integer(obj):
         if self._frozen:
             return self._frozen_value.to_bytes(self.size, self.endianness, signed=self.signed)
 
-        return self.resolver.resolve(self.size, 0)
+        return bytes(self.resolver.resolve(self.size, 0))
 
     def _set(self: _c_integer, value: int) -> None:
         """Set the value of the integer to the given value."""
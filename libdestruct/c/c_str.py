@@ -6,51 +6,97 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from libdestruct.common.array.array import array
 
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Generator
+
+    from libdestruct.backing.resolver import Resolver
+
 
 class c_str(array):
     """A C string."""
 
-    def count(self: c_str) -> int:
-        """Return the size of the string."""
-        size = 0
+    max_length: int | None = None
+    """The maximum length of the string, beyond which it is truncated. If None, the string is unbounded."""
+
+    _length: int | None = None
+    """The length found by the last scan, used as a hint for the next access."""
+
+    def __init__(self: c_str, resolver: Resolver, max_length: int | None = None) -> None:
+        """Initialize the string.
+
+        Args:
+            resolver: The backing resolver for the string.
+            max_length: The maximum length of the string, beyond which it is truncated.
+        """
+        super().__init__(resolver)
+
+        if max_length is not None:
+            self.max_length = max_length
+
+    def _scan(self: c_str) -> bytes:
+        """Read the string in page-aligned chunks, until the terminator is found."""
+        (data,) = self.resolver.resolve_strings([self.address], self.max_length)
 
-        try:
-            while self.resolver.resolve(size, 0)[-1:] != b"\x00":
-                size += 1
-        except IndexError as e:
-            raise RuntimeError("String is not null-terminated.") from e
+        if data is None:
+            raise RuntimeError("String is not null-terminated.")
 
-        return size - 1
+        return data
+
+    def _read(self: c_str) -> bytes:
+        """Return the content of the string, with a single read if the length found by the last scan is still valid."""
+        hint = self._length
+
+        if hint is not None:
+            # The hint is valid if the string has no earlier terminator, and still ends there or is truncated there
+            data = self.resolver.resolve_readable(self.address, hint + 1)
+
+            if len(data) >= hint and b"\x00" not in data[:hint] and (data[hint:] == b"\x00" or hint == self.max_length):
+                return data[:hint]
+
+        data = self._scan()
+        self._length = len(data)
+        return data
+
+    def count(self: c_str) -> int:
+        """Return the size of the string."""
+        return len(self._read())
 
     def get(self: c_str, index: int = -1) -> bytes:
         """Return the character at the given index."""
-        if index != -1 and index < 0 or index >= self.count():
+        value = self._read()
+
+        if index != -1 and index < 0 or index >= len(value):
             raise IndexError("String index out of range.")
 
         if index == -1:
-            return self.resolver.resolve(self.count(), 0)
+            return value
 
-        return bytes([self.resolver.resolve(index)[-1]])
+        return value[index : index + 1]
 
     def to_bytes(self: c_str) -> bytes:
         """Return the serialized representation of the object."""
-        return self.resolver.resolve(self.count(), 0)
+        return self._read()
 
     def _set(self: c_str, value: bytes, index: int = -1) -> None:
         """Set the character at the given index to the given value."""
         if index != -1 and index < 0 or index >= self.count():
             raise IndexError("String index out of range.")
 
+        # The terminator may move, so the length has to be scanned again
+        self._length = None
+
         if index == -1:
             # This is rather clunky
             self.resolver.modify(len(value), 0, value)
         else:
-            prev = self.resolver.resolve(index, 0)
+            prev = bytes(self.resolver.resolve(index, 0))
             self.resolver.modify(index + len(value), 0, prev + value)
 
-    def __iter__(self: c_str) -> iter:
+    def __iter__(self: c_str) -> Generator[bytes, None, None]:
         """Return an iterator over the string."""
-        for i in range(self.count()):
-            yield self.get(i)
+        for character in self._read():
+            yield bytes([character])
@@ -9,4 +9,5 @@ from libdestruct.common.array.array_of import array_of
 
 __all__ = ["array", "array_of"]
 
+import libdestruct.common.array.array_codec
 import libdestruct.common.array.array_field_inflater  # noqa: F401
@@ -0,0 +1,20 @@
+#
+# This file is part of libdestruct (https://github.com/mrindeciso/libdestruct).
+# Copyright (c) 2024 Roberto Alessandro Bertolini. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+from __future__ import annotations
+
+from libdestruct.common.array.linear_array_field import LinearArrayField
+from libdestruct.common.codec import Codec, CodecRegistry
+
+registry = CodecRegistry()
+
+
+def linear_array_codec(field: LinearArrayField) -> Codec:
+    """Return the codec for a linear array, which decodes to a list."""
+    return registry.array_codec_for(field.item, field.size)
+
+
+registry.register_instance_handler(LinearArrayField, linear_array_codec)
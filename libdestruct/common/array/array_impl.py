@@ -6,61 +6,451 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from struct import error as struct_error
 from typing import TYPE_CHECKING
 
 from libdestruct.common.array.array import array
+from libdestruct.common.codec import ArrayCodec, CodecRegistry, StructCodec, codec_ndarray
+from libdestruct.common.obj import obj
 from libdestruct.common.struct.struct import struct
 from libdestruct.common.utils import size_of
 
 if TYPE_CHECKING:  # pragma: no cover
     from collections.abc import Generator
 
+    import numpy as np
+
     from libdestruct.backing.resolver import Resolver
-    from libdestruct.common.obj import obj
 
 
 class array_impl(array):
     """A linear sequential array."""
 
     size: int
-    """The size of the array."""
+    """The size of the array, i.e. the span of memory from its first to its last item."""
 
     item_size: int
     """The size of each item in the array."""
 
+    stride: int
+    """The distance in bytes between the starts of consecutive items, larger than the item size for strided views."""
+
     def __init__(
         self: array_impl,
         resolver: Resolver,
         backing_type: obj,
         count: int,
+        stride: int | None = None,
     ) -> None:
-        """Initialize the array."""
+        """Initialize the array.
+
+        Args:
+            resolver: The backing resolver for the array.
+            backing_type: The inflater of the items.
+            count: The number of items.
+            stride: The distance in bytes between consecutive items. Defaults to the size of an item.
+        """
         super().__init__(resolver)
 
         self.backing_type = backing_type
         self._count = count
         self.item_size = size_of(self.backing_type)
-        self.size = self.item_size * self._count
+        self.stride = stride or self.item_size
+        self.size = (self._count - 1) * self.stride + self.item_size if self._count else 0
 
     def count(self: array_impl) -> int:
         """Get the size of the array."""
         return self._count
 
+    def _normalize_index(self: array_impl, index: int) -> int:
+        """Return the non-negative index of an item, counting negative indices from the end of the array."""
+        if index < 0:
+            index += self._count
+
+        if not 0 <= index < self._count:
+            raise IndexError("Array index out of range.")
+
+        return index
+
     def get(self: array, index: int) -> object:
         """Return the element at the given index."""
-        return self.backing_type(self.resolver.relative_from_own(index * self.item_size, 0))
+        index = self._normalize_index(index)
+        element = self.backing_type(self.resolver.relative_from_own(index * self.stride, 0))
+
+        if self._frozen:
+            element._freeze_value(self._frozen_value[index])
+
+        return element
+
+    def codec(self: array_impl) -> ArrayCodec:
+        """Return the codec of the array, which decodes it to a list of the values of its elements."""
+        return CodecRegistry().array_codec_for(self.backing_type, self._count)
+
+    def _window_codec(self: array_impl) -> ArrayCodec:
+        """Return the codec of the memory spanned by the array, which skips the gaps between strided items."""
+        return CodecRegistry().array_codec_for(self.backing_type, self._count, self.stride)
+
+    def __getitem__(self: array_impl, index: int | slice) -> obj | array_impl:
+        """Return the element at the given index, or a view of the given slice of the array."""
+        if isinstance(index, slice):
+            return self._view(index)
+
+        return self.get(index)
+
+    def _view(self: array_impl, index: slice) -> array_impl:
+        """Return a view of a slice of the array, which shares its backing resolver."""
+        start, stop, step = index.indices(self._count)
+
+        if step < 0:
+            raise ValueError("Slices with a negative step are not supported.")
+
+        view = array_impl(
+            self.resolver.relative_from_own(start * self.stride, 0),
+            self.backing_type,
+            len(range(start, stop, step)),
+            self.stride * step,
+        )
+
+        if self._frozen:
+            view._freeze_value(self._frozen_value[index])
+
+        return view
+
+    def chunks(self: array_impl, chunk_size: int) -> Generator[array_impl, None, None]:
+        """Iterate over consecutive views of the array, each with at most the given number of items.
+
+        Each view reads its own window only, so huge arrays can be processed with bounded memory.
+
+        Args:
+            chunk_size: The maximum number of items of each view.
+        """
+        if chunk_size <= 0:
+            raise ValueError("The chunk size must be positive.")
+
+        for start in range(0, self._count, chunk_size):
+            yield self._view(slice(start, start + chunk_size))
+
+    def _encode(self: array_impl, values: list[object]) -> bytes:
+        """Return the serialized representation of the given items.
+
+        Items can be Python values, as returned by `values()`, or objects of the item size. Items of structs are
+        dicts of the values of their members, and items of arrays are lists of the values of their items.
+        """
+        registry = CodecRegistry()
+        item = registry.codec_for(self.backing_type)
+
+        for value in values:
+            if isinstance(item, StructCodec) and not isinstance(value, obj | Mapping):
+                raise NotImplementedError("Items of a struct type can only be set from objects or dicts.")
+
+            if isinstance(item, ArrayCodec) and not isinstance(value, obj | list | tuple):
+                raise NotImplementedError("Items of an array type can only be set from objects or lists.")
+
+        if not any(isinstance(value, obj) for value in values):
+            # Encode all the items with a single pack
+            return registry.array_codec_for(self.backing_type, len(values)).pack(values, self.endianness)
+
+        chunks = []
+
+        for value in values:
+            if isinstance(value, obj):
+                if size_of(value) != self.item_size:
+                    raise ValueError("The object has a different size than the items of the array.")
 
-    def _set(self: array_impl, _: list[obj]) -> None:
-        """Set the array from a list."""
-        raise NotImplementedError("Cannot set items in an array.")
+                chunks.append(value.to_bytes())
+            else:
+                chunks.append(item.pack(value, self.endianness))
 
-    def set(self: array_impl, _: list[obj]) -> None:
-        """Set the array from a list."""
-        raise NotImplementedError("Cannot set items in an array.")
+        return b"".join(chunks)
+
+    def _write(self: array_impl, data: bytes) -> None:
+        """Write the serialized representation of all the items with a single modify."""
+        if len(data) != self._count * self.item_size:
+            raise ValueError(f"Expected {self._count * self.item_size} bytes, got {len(data)}.")
+
+        if self.stride == self.item_size:
+            self.resolver.modify(len(data), 0, bytes(data))
+            return
+
+        # Strided views must preserve the gaps between their items
+        window = bytearray(self.resolver.resolve(self.size, 0))
+
+        for index in range(self._count):
+            offset = index * self.stride
+            window[offset : offset + self.item_size] = data[index * self.item_size : (index + 1) * self.item_size]
+
+        self.resolver.modify(self.size, 0, bytes(window))
+
+    def _set(self: array_impl, values: list[object]) -> None:
+        """Set all the items of the array, with a single write."""
+        self._write(self._encode(list(values)))
+
+    def fill(self: array_impl, value: object) -> None:
+        """Set all the items of the array to the same value, with a single write.
+
+        Args:
+            value: The value of the items, or an object of the item size.
+        """
+        if self._frozen:
+            raise ValueError("Cannot set the value of a frozen object.")
+
+        self._write(self._encode([value]) * self._count)
+
+    def write_bytes(self: array_impl, data: bytes) -> None:
+        """Overwrite the items of the array with their serialized representation, with a single write.
+
+        Args:
+            data: The serialized items, whose size must match the one of the array.
+        """
+        if self._frozen:
+            raise ValueError("Cannot set the value of a frozen object.")
+
+        self._write(data)
 
     def to_bytes(self: array_impl) -> bytes:
         """Return the serialized representation of the array."""
-        return b"".join(bytes(x) for x in self)
+        if self._frozen:
+            return self.codec().pack(self._frozen_value, self.endianness)
+
+        return self._read_bytes()
+
+    def _read_bytes(self: array_impl) -> bytes:
+        """Return the current serialized representation of the array, read from memory even if it is frozen."""
+        data = self.resolver.resolve(self.size, 0)
+
+        if self.stride == self.item_size:
+            return bytes(data)
+
+        return b"".join(data[offset : offset + self.item_size] for offset in range(0, self.size, self.stride))
+
+    def values(self: array_impl) -> list[object]:
+        """Return the values of the elements of the array, decoded from a single read.
+
+        Integers and pointers are returned as plain ints, and structs as dicts of the values of their members.
+        """
+        if self._frozen:
+            return list(self._frozen_value)
+
+        return self._read_values()
+
+    def _read_values(self: array_impl) -> list[object]:
+        """Return the current values of the elements of the array, read from memory even if it is frozen."""
+        return self._window_codec().unpack(self.resolver.resolve(self.size, 0), self.endianness)
+
+    def tolist(self: array_impl) -> list[object]:
+        """Return the values of the elements of the array as a list, decoded from a single read."""
+        return self.values()
+
+    def read_strings(self: array_impl, max_length: int | None = None) -> list[bytes | None]:
+        """Read the NUL-terminated strings pointed to by an array of pointers, such as a `char *argv[]` table.
+
+        The pointers are read at once, and the strings are fetched in batches of pages.
+
+        Args:
+            max_length: The maximum length of each string, beyond which it is truncated.
+
+        Returns:
+            The content of each string, or None for null pointers, pointers to unmapped memory and strings which run
+            into unreadable memory before their terminator.
+        """
+        addresses = self.values()
+        valid = self._valid_pointers(addresses, 1)
+
+        strings = self.resolver.resolve_strings([addresses[index] for index in valid], max_length)
+
+        result = [None] * len(addresses)
+
+        for index, string in zip(valid, strings, strict=True):
+            result[index] = string
+
+        return result
+
+    def unwrap_all(self: array_impl) -> list[obj | None]:
+        """Return the objects pointed to by an array of typed pointers, such as the buckets of a hash table.
+
+        The pointers are read at once, and the targets are fetched with a single batched read, which merges the
+        adjacent and overlapping ones. If that read fails, the targets are read one at a time. The objects are frozen
+        snapshots of the targets, decoded from that read, so they are neither taken from nor added to the identity map.
+
+        Returns:
+            The object pointed to by each pointer, or None for null pointers and pointers to unreadable memory.
+        """
+        if not self._count:
+            return []
+
+        wrapper = getattr(self.get(0), "wrapper", None)
+
+        if wrapper is None:
+            raise TypeError("Only arrays of pointers to a known type can be unwrapped.")
+
+        target_size = size_of(wrapper)
+        codec = CodecRegistry().codec_for(wrapper)
+
+        addresses = self.values()
+        valid = self._valid_pointers(addresses, target_size)
+        contents = self.resolver.try_resolve_many([(addresses[index], target_size) for index in valid])
+
+        result = [None] * len(addresses)
+
+        for index, data in zip(valid, contents, strict=True):
+            if data is None or len(data) < target_size:
+                # The target is unreadable, or the backing storage ended before its end
+                continue
+
+            target = wrapper(self.resolver.absolute_from_own(addresses[index]))
+            target._freeze_value(codec.unpack(data, target.endianness))
+            result[index] = target
+
+        return result
+
+    def _valid_pointers(self: array_impl, addresses: list[int], size: int) -> list[int]:
+        """Return the indices of the non-null pointers whose targets of the given size are mapped, if known."""
+        memory_map = self.resolver.memory_map
+
+        return [
+            index
+            for index, address in enumerate(addresses)
+            if address and (memory_map is None or memory_map.is_mapped(address, size))
+        ]
+
+    def to_numpy(self: array_impl) -> np.ndarray:
+        """Return the array as a NumPy array, with a structured dtype for arrays of structs.
+
+        The result is a zero-copy view when the backing memory exposes the buffer protocol, and is decoded from a single
+        read otherwise. Views over writable memory are writable, and writes to them are reflected in the memory.
+        """
+        item_codec = CodecRegistry().codec_for(self.backing_type)
+
+        if self._frozen:
+            return codec_ndarray(item_codec, self.to_bytes(), self._count, self.endianness)
+
+        data = self.resolver.resolve_view(self.size)
+        return codec_ndarray(item_codec, data, self._count, self.endianness, self.stride)
+
+    def freeze(self: array_impl) -> None:
+        """Freeze the array, decoding the values of all its elements from a single read."""
+        self._freeze_value(self._read_values())
+
+    def diff(self: array_impl) -> tuple[list[object], list[object]]:
+        """Return the frozen values of the elements of the array and their current values."""
+        if not self._frozen:
+            raise RuntimeError("Cannot diff an array which is not frozen.")
+
+        return list(self._frozen_value), self._read_values()
+
+    def update(self: array_impl) -> None:
+        """Update the frozen values of the elements of the array from a single read."""
+        if not self._frozen:
+            raise RuntimeError("Cannot update an array which is not frozen.")
+
+        self._frozen_value = self._read_values()
+
+    def pdiff(self: array_impl) -> str:
+        """Return a string representation of the elements which changed since the array was frozen."""
+        if not self._frozen:
+            raise RuntimeError("Cannot diff an array which is not frozen.")
+
+        changes = self.codec().diff(self.to_bytes(), self._read_bytes(), self.endianness)
+        return "\n".join(f"{path}: {old} -> {new}" for path, (old, new) in changes.items())
+
+    def _pattern(self: array_impl, value: object, field: str | None) -> tuple[bytes | None, int]:
+        """Return the serialized representation of a value of an item or of one of its fields, and its offset.
+
+        The representation is None if the value cannot be encoded by the type, which thus never contains it.
+        """
+        codec = CodecRegistry().codec_for(self.backing_type)
+        offset = 0
+
+        if field is not None:
+            leaves = {path: (leaf_offset, leaf) for path, leaf_offset, leaf in codec.leaves()}
+
+            if field not in leaves:
+                raise ValueError(f"The items of the array have no primitive field {field}.")
+
+            offset, codec = leaves[field]
+
+        if isinstance(value, obj):
+            if size_of(value) != codec.size:
+                raise ValueError("The object has a different size than the searched items.")
+
+            return value.to_bytes(), offset
+
+        try:
+            return codec.pack(value, self.endianness), offset
+        except struct_error:
+            return None, offset
+
+    def _matches(self: array_impl, value: object, field: str | None, start: int = 0) -> Generator[int, None, None]:
+        """Yield the indices of the items matching the value, searching the bytes of the array from a single read."""
+        pattern, offset = self._pattern(value, field)
+
+        if pattern is None or start >= self._count:
+            return
+
+        if self._frozen:
+            data, stride = self.to_bytes(), self.item_size
+        else:
+            data, stride = bytes(self.resolver.resolve(self.size, 0)), self.stride
+
+        position = data.find(pattern, max(start, 0) * stride + offset)
+
+        while position != -1:
+            index, remainder = divmod(position - offset, stride)
+
+            if index >= self._count:
+                return
+
+            if remainder == 0:
+                yield index
+                position = data.find(pattern, position + stride)
+            else:
+                # The pattern is not aligned to an item, so we resume the search from the next one
+                position = data.find(pattern, (index + 1) * stride + offset)
+
+    def find(self: array_impl, value: object, field: str | None = None, start: int = 0) -> int:
+        """Return the index of the first item equal to the value, or -1 if there is none.
+
+        Items are compared byte for byte, on a single read of the array.
+
+        Args:
+            value: The value to search, either a Python value or an object of the same size as the items.
+            field: The path of a primitive field of the items to compare instead of the whole items, such as "a.b[3]".
+            start: The index to start the search from.
+        """
+        return next(self._matches(value, field, start), -1)
+
+    def index(self: array_impl, value: object, field: str | None = None, start: int = 0) -> int:
+        """Return the index of the first item equal to the value, raising ValueError if there is none.
+
+        Args:
+            value: The value to search, either a Python value or an object of the same size as the items.
+            field: The path of a primitive field of the items to compare instead of the whole items, such as "a.b[3]".
+            start: The index to start the search from.
+        """
+        index = self.find(value, field, start)
+
+        if index == -1:
+            raise ValueError(f"{value} is not in the array.")
+
+        return index
+
+    def count_of(self: array_impl, value: object, field: str | None = None) -> int:
+        """Return the number of items equal to the value.
+
+        Args:
+            value: The value to search, either a Python value or an object of the same size as the items.
+            field: The path of a primitive field of the items to compare instead of the whole items, such as "a.b[3]".
+        """
+        return sum(1 for _ in self._matches(value, field))
+
+    def __contains__(self: array_impl, value: object) -> bool:
+        """Return whether the array contains the given value."""
+        if isinstance(value, obj) and size_of(value) != self.item_size:
+            # Objects of other types can only be compared by value
+            return super().__contains__(value)
+
+        return self.find(value) != -1
 
     def to_str(self: array_impl, indent: int = 0) -> str:
         """Return the string representation of the array."""
@@ -75,9 +465,20 @@ class array_impl(array):
 
         return "[" + ", ".join(x.to_str(indent + 4) for x in self) + "]"
 
-    def __setitem__(self: array_impl, index: int, value: obj) -> None:
-        """Set an item in the array."""
-        raise NotImplementedError("Cannot set items in an array.")
+    def __setitem__(self: array_impl, index: int | slice, value: object) -> None:
+        """Set the item at the given index, or the items of the given slice from an iterable, with a single write."""
+        if self._frozen:
+            raise ValueError("Cannot set the value of a frozen object.")
+
+        if isinstance(index, slice):
+            view = self._view(index)
+            view._write(view._encode(list(value)))
+            return
+
+        index = self._normalize_index(index)
+
+        data = self._encode([value])
+        self.resolver.relative_from_own(index * self.stride, 0).modify(self.item_size, 0, data)
 
     def __iter__(self: array_impl) -> Generator[obj, None, None]:
         """Iterate over the array."""
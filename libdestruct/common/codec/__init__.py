@@ -0,0 +1,20 @@
+#
+# This file is part of libdestruct (https://github.com/mrindeciso/libdestruct).
+# Copyright (c) 2024 Roberto Alessandro Bertolini. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+from libdestruct.common.codec.codec import ArrayCodec, Codec, PrimitiveCodec, RawCodec, StructCodec
+from libdestruct.common.codec.codec_dtype import codec_dtype, codec_ndarray
+from libdestruct.common.codec.codec_registry import CodecRegistry
+
+__all__ = [
+    "ArrayCodec",
+    "Codec",
+    "CodecRegistry",
+    "PrimitiveCodec",
+    "RawCodec",
+    "StructCodec",
+    "codec_dtype",
+    "codec_ndarray",
+]
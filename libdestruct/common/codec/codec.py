@@ -0,0 +1,368 @@
+#
+# This file is part of libdestruct (https://github.com/mrindeciso/libdestruct).
+# Copyright (c) 2024 Roberto Alessandro Bertolini. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from bisect import bisect_right
+from itertools import islice
+from struct import Struct
+from typing import TYPE_CHECKING
+
+from libdestruct.backing.memory_resolver import MemoryResolver
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Callable, Generator, Iterator, Mapping
+
+    from libdestruct.backing.resolver import Resolver
+    from libdestruct.common.obj import obj
+
+
+INTEGER_FORMATS = {1: "b", 2: "h", 4: "i", 8: "q"}
+"""The struct format characters of the signed integers, by size."""
+
+DIFF_BLOCK_SIZE = 64
+"""The size of the blocks compared at once when looking for differences between two buffers."""
+
+
+def join_path(prefix: str, path: str) -> str:
+    """Join the path of a component to the path of its container, e.g. "a" and "b[3]" into "a.b[3]".
+
+    Args:
+        prefix: The path of the container.
+        path: The path of the component, relative to the container.
+    """
+    if not path or path.startswith("["):
+        return prefix + path
+
+    return f"{prefix}.{path}"
+
+
+def integer_format(size: int, signed: bool) -> str | None:
+    """Return the struct format character of an integer of the given size, if there is one.
+
+    Args:
+        size: The size of the integer in bytes.
+        signed: Whether the integer is signed.
+    """
+    format_char = INTEGER_FORMATS.get(size)
+
+    if format_char is None:
+        return None
+
+    return format_char if signed else format_char.upper()
+
+
+class Codec(ABC):
+    """A converter between the serialized representation of a fixed-size type and its Python value.
+
+    Codecs are composed into a single struct format, so that a whole object is decoded with one unpack call.
+    """
+
+    format: str
+    """The struct format of the type, without the byte order prefix."""
+
+    size: int
+    """The size of the type in bytes."""
+
+    def __init__(self: Codec) -> None:
+        """Initialize the codec."""
+        self._compiled: dict[str, Struct] = {}
+        self._leaves: list[tuple[str, int, Codec]] | None = None
+        self._leaf_offsets: list[int] = []
+
+    @abstractmethod
+    def decode(self: Codec, items: Iterator[object]) -> object:
+        """Build the value of the type from the items produced by its struct format.
+
+        Args:
+            items: The unpacked items, consumed in order.
+        """
+
+    @abstractmethod
+    def encode(self: Codec, value: object, items: list[object]) -> None:
+        """Append the items of the struct format which represent the given value.
+
+        Args:
+            value: The value to encode.
+            items: The list of items to pack.
+        """
+
+    def compile(self: Codec, endianness: str = "little") -> Struct:
+        """Return the compiled struct format of the type.
+
+        Args:
+            endianness: The byte order, either "little" or "big".
+        """
+        compiled = self._compiled.get(endianness)
+
+        if compiled is None:
+            compiled = Struct(("<" if endianness == "little" else ">") + self.format)
+            self._compiled[endianness] = compiled
+
+        return compiled
+
+    def unpack(self: Codec, data: bytes, endianness: str = "little", offset: int = 0) -> object:
+        """Decode a value from its serialized representation.
+
+        Args:
+            data: The buffer to decode.
+            endianness: The byte order, either "little" or "big".
+            offset: The offset of the value in the buffer.
+        """
+        return self.decode(iter(self.compile(endianness).unpack_from(data, offset)))
+
+    def _components(self: Codec) -> list[tuple[str, int, Codec]]:
+        """Return the primitive components of the type, as (path, offset, codec) tuples."""
+        return [("", 0, self)]
+
+    def leaves(self: Codec) -> list[tuple[str, int, Codec]]:
+        """Return the primitive components of the type, as (path, offset, codec) tuples sorted by offset.
+
+        Paths are relative to the type, such as "a.b[3].c".
+        """
+        if self._leaves is None:
+            self._leaves = self._components()
+            self._leaf_offsets = [offset for _, offset, _ in self._leaves]
+
+        return self._leaves
+
+    def differing(self: Codec, old: bytes, new: bytes) -> Generator[tuple[str, int, Codec]]:
+        """Yield the primitive components of the type whose bytes differ between two serialized representations.
+
+        Padding bytes, which belong to no component, are ignored.
+
+        Args:
+            old: The first serialized representation.
+            new: The second serialized representation.
+        """
+        old, new = memoryview(old), memoryview(new)
+
+        if old[: self.size] == new[: self.size]:
+            return
+
+        leaves = self.leaves()
+        last = -1
+
+        for block in range(0, self.size, DIFF_BLOCK_SIZE):
+            block_end = block + DIFF_BLOCK_SIZE
+
+            if old[block:block_end] == new[block:block_end]:
+                continue
+
+            # Check only the components which overlap the block, and were not checked already
+            index = max(bisect_right(self._leaf_offsets, block) - 1, last + 1)
+
+            while index < len(leaves) and self._leaf_offsets[index] < block_end:
+                path, offset, codec = leaves[index]
+
+                if old[offset : offset + codec.size] != new[offset : offset + codec.size]:
+                    yield path, offset, codec
+
+                last = index
+                index += 1
+
+    def diff(
+        self: Codec,
+        old: bytes,
+        new: bytes,
+        endianness: str = "little",
+    ) -> dict[str, tuple[object, object]]:
+        """Return the values of the primitive components which differ between two serialized representations.
+
+        Args:
+            old: The first serialized representation.
+            new: The second serialized representation.
+            endianness: The byte order, either "little" or "big".
+
+        Returns:
+            A mapping from the path of each differing component to its (old, new) values.
+        """
+        return {
+            path: (codec.unpack(old, endianness, offset), codec.unpack(new, endianness, offset))
+            for path, offset, codec in self.differing(old, new)
+        }
+
+    def pack(self: Codec, value: object, endianness: str = "little") -> bytes:
+        """Encode a value into its serialized representation.
+
+        Args:
+            value: The value to encode.
+            endianness: The byte order, either "little" or "big".
+        """
+        items = []
+        self.encode(value, items)
+        return self.compile(endianness).pack(*items)
+
+
+class PrimitiveCodec(Codec):
+    """A codec for a type which maps to a single struct format item."""
+
+    def __init__(
+        self: PrimitiveCodec,
+        format_char: str,
+        size: int,
+        decoder: Callable[[object], object] | None = None,
+        encoder: Callable[[object], object] | None = None,
+    ) -> None:
+        """Initialize the codec.
+
+        Args:
+            format_char: The struct format character of the type.
+            size: The size of the type in bytes.
+            decoder: A conversion applied to the unpacked item, if any.
+            encoder: A conversion applied to the value before packing it, if any.
+        """
+        super().__init__()
+        self.format = format_char
+        self.size = size
+        self.decoder = decoder
+        self.encoder = encoder
+
+    def decode(self: PrimitiveCodec, items: Iterator[object]) -> object:
+        """Build the value of the type from the items produced by its struct format."""
+        item = next(items)
+        return item if self.decoder is None else self.decoder(item)
+
+    def encode(self: PrimitiveCodec, value: object, items: list[object]) -> None:
+        """Append the items of the struct format which represent the given value."""
+        items.append(value if self.encoder is None else self.encoder(value))
+
+
+class RawCodec(Codec):
+    """A codec for a type with no struct format, which inflates the type over its raw bytes."""
+
+    def __init__(self: RawCodec, inflater: Callable[[Resolver], obj], size: int) -> None:
+        """Initialize the codec.
+
+        Args:
+            inflater: The inflater for the type.
+            size: The size of the type in bytes.
+        """
+        super().__init__()
+        self.inflater = inflater
+        self.format = f"{size}s"
+        self.size = size
+
+    def decode(self: RawCodec, items: Iterator[object]) -> object:
+        """Build the value of the type from the items produced by its struct format."""
+        return self.inflater(MemoryResolver(next(items), 0)).get()
+
+    def encode(self: RawCodec, value: object, items: list[object]) -> None:
+        """Append the items of the struct format which represent the given value."""
+        buffer = bytearray(self.size)
+        self.inflater(MemoryResolver(buffer, 0)).value = value
+        items.append(bytes(buffer))
+
+
+class ArrayCodec(Codec):
+    """A codec for a linear array of a fixed-size type."""
+
+    def __init__(self: ArrayCodec, item: Codec, count: int, stride: int | None = None) -> None:
+        """Initialize the codec.
+
+        Args:
+            item: The codec of the items.
+            count: The number of items.
+            stride: The distance in bytes between consecutive items. Defaults to the size of an item.
+        """
+        super().__init__()
+        self.item = item
+        self.count = count
+        self.stride = stride or item.size
+        self.size = (count - 1) * self.stride + item.size if count else 0
+
+        if self.stride != item.size:
+            # The gaps between the items are skipped as padding
+            self.format = f"{item.format}{self.stride - item.size}x" * (count - 1) + item.format if count else ""
+        elif isinstance(item, PrimitiveCodec):
+            self.format = f"{count}{item.format}"
+        else:
+            self.format = item.format * count
+
+    def _components(self: ArrayCodec) -> list[tuple[str, int, Codec]]:
+        """Return the primitive components of the type, as (path, offset, codec) tuples."""
+        item_leaves = self.item.leaves()
+
+        return [
+            (join_path(f"[{index}]", path), index * self.stride + offset, codec)
+            for index in range(self.count)
+            for path, offset, codec in item_leaves
+        ]
+
+    def decode(self: ArrayCodec, items: Iterator[object]) -> list[object]:
+        """Build the value of the type from the items produced by its struct format."""
+        item = self.item
+
+        if isinstance(item, PrimitiveCodec):
+            # Decode the whole run of items at C speed
+            if item.decoder is None:
+                return list(islice(items, self.count))
+
+            return list(map(item.decoder, islice(items, self.count)))
+
+        return [item.decode(items) for _ in range(self.count)]
+
+    def encode(self: ArrayCodec, value: list[object], items: list[object]) -> None:
+        """Append the items of the struct format which represent the given value."""
+        if len(value) != self.count:
+            raise ValueError(f"Expected {self.count} items, got {len(value)}.")
+
+        item = self.item
+
+        if isinstance(item, PrimitiveCodec):
+            items.extend(value if item.encoder is None else map(item.encoder, value))
+            return
+
+        for element in value:
+            item.encode(element, items)
+
+
+class StructCodec(Codec):
+    """A codec for a struct, whose members are laid out at fixed offsets."""
+
+    def __init__(self: StructCodec, members: list[tuple[str, int, Codec]], size: int) -> None:
+        """Initialize the codec.
+
+        Args:
+            members: The members of the struct, as (name, offset, codec) tuples sorted by offset.
+            size: The size of the struct in bytes.
+        """
+        super().__init__()
+        self.members = members
+        self.size = size
+
+        formats = []
+        current_offset = 0
+
+        for _, offset, codec in members:
+            if offset > current_offset:
+                formats.append(f"{offset - current_offset}x")
+
+            formats.append(codec.format)
+            current_offset = offset + codec.size
+
+        if size > current_offset:
+            formats.append(f"{size - current_offset}x")
+
+        self.format = "".join(formats)
+
+    def _components(self: StructCodec) -> list[tuple[str, int, Codec]]:
+        """Return the primitive components of the type, as (path, offset, codec) tuples."""
+        return [
+            (join_path(name, path), member_offset + offset, codec)
+            for name, member_offset, member_codec in self.members
+            for path, offset, codec in member_codec.leaves()
+        ]
+
+    def decode(self: StructCodec, items: Iterator[object]) -> dict[str, object]:
+        """Build the value of the type from the items produced by its struct format."""
+        return {name: codec.decode(items) for name, _, codec in self.members}
+
+    def encode(self: StructCodec, value: Mapping[str, object], items: list[object]) -> None:
+        """Append the items of the struct format which represent the given value."""
+        for name, _, codec in self.members:
+            codec.encode(value[name], items)
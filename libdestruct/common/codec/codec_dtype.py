@@ -0,0 +1,90 @@
+#
+# This file is part of libdestruct (https://github.com/mrindeciso/libdestruct).
+# Copyright (c) 2024 Roberto Alessandro Bertolini. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+from __future__ import annotations
+
+from libdestruct.common.codec.codec import ArrayCodec, Codec, PrimitiveCodec, StructCodec
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+NUMPY_TYPES = {
+    "b": "i1",
+    "B": "u1",
+    "h": "i2",
+    "H": "u2",
+    "i": "i4",
+    "I": "u4",
+    "q": "i8",
+    "Q": "u8",
+    "f": "f4",
+    "d": "f8",
+    "?": "b1",
+    "c": "S1",
+}
+"""The NumPy type codes of the struct format characters."""
+
+
+def codec_dtype(codec: Codec, endianness: str = "little") -> np.dtype:
+    """Return the NumPy dtype with the same memory layout as the given codec.
+
+    Structs become structured dtypes with explicit offsets, arrays become subarrays and pointers become unsigned
+    64-bit integers. Types with no NumPy equivalent become opaque void fields.
+
+    Args:
+        codec: The codec of the type.
+        endianness: The byte order, either "little" or "big".
+    """
+    if np is None:
+        raise ImportError("NumPy is required to build dtypes, install it with `pip install libdestruct[numpy]`.")
+
+    return _codec_dtype(codec, "<" if endianness == "little" else ">")
+
+
+def codec_ndarray(
+    codec: Codec,
+    data: bytes,
+    count: int,
+    endianness: str = "little",
+    stride: int | None = None,
+) -> np.ndarray:
+    """Return a NumPy array of the given type over a buffer, without copying it.
+
+    Args:
+        codec: The codec of the items.
+        data: The buffer, which must expose the buffer protocol.
+        count: The number of items.
+        endianness: The byte order, either "little" or "big".
+        stride: The distance in bytes between consecutive items. Defaults to the size of an item.
+    """
+    dtype = codec_dtype(codec, endianness)
+
+    if stride is None or stride == codec.size or count == 0:
+        return np.frombuffer(data, dtype=dtype, count=count)
+
+    return np.ndarray((count,), dtype=dtype, buffer=data, strides=(stride,))
+
+
+def _codec_dtype(codec: Codec, byte_order: str) -> np.dtype:
+    if isinstance(codec, StructCodec):
+        return np.dtype(
+            {
+                "names": [name for name, _, _ in codec.members],
+                "formats": [_codec_dtype(member, byte_order) for _, _, member in codec.members],
+                "offsets": [offset for _, offset, _ in codec.members],
+                "itemsize": codec.size,
+            },
+        )
+
+    if isinstance(codec, ArrayCodec):
+        return np.dtype((_codec_dtype(codec.item, byte_order), (codec.count,)))
+
+    if isinstance(codec, PrimitiveCodec) and codec.format in NUMPY_TYPES:
+        return np.dtype(byte_order + NUMPY_TYPES[codec.format])
+
+    return np.dtype(f"V{codec.size}")
@@ -0,0 +1,127 @@
+#
+# This file is part of libdestruct (https://github.com/mrindeciso/libdestruct).
+# Copyright (c) 2024 Roberto Alessandro Bertolini. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from libdestruct.common.codec.codec import ArrayCodec, Codec, RawCodec
+from libdestruct.common.field import Field
+from libdestruct.common.utils import size_of
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Callable
+
+    from typing_extensions import Self
+
+    from libdestruct.backing.resolver import Resolver
+    from libdestruct.common.obj import obj
+
+
+class CodecRegistry:
+    """A registry for the codecs of the fixed-size types."""
+
+    cache: dict[object, Codec]
+    """The codecs already built, by inflater."""
+
+    type_handlers: dict[type, list[Callable[[type[obj]], Codec | None]]]
+    """The handlers for object types, with basic inheritance support."""
+
+    instance_handlers: dict[type, list[Callable[[Field], Codec | None]]]
+    """The handlers for the inflaters of fields."""
+
+    def __new__(cls: type[CodecRegistry]) -> Self:
+        """Create a new instance of the codec registry."""
+        if not hasattr(cls, "_instance"):
+            cls._instance = super().__new__(cls)
+
+            cls._instance.cache = {}
+            cls._instance.type_handlers = {}
+            cls._instance.instance_handlers = {}
+
+        return cls._instance
+
+    def codec_for(self: CodecRegistry, inflater: type[obj] | Callable[[Resolver], obj]) -> Codec:
+        """Return the codec for the objects built by the given inflater.
+
+        Types with no registered codec are decoded by inflating them over their raw bytes.
+
+        Args:
+            inflater: The inflater, either an object type or the bound inflate method of a field.
+        """
+        codec = self.cache.get(inflater)
+
+        if codec is None:
+            codec = self._codec_for_inflater(inflater) or RawCodec(inflater, size_of(inflater))
+            self.cache[inflater] = codec
+
+        return codec
+
+    def array_codec_for(
+        self: CodecRegistry,
+        inflater: type[obj] | Callable[[Resolver], obj],
+        count: int,
+        stride: int | None = None,
+    ) -> ArrayCodec:
+        """Return the codec for a linear array of the objects built by the given inflater.
+
+        Args:
+            inflater: The inflater of the items.
+            count: The number of items.
+            stride: The distance in bytes between consecutive items. Defaults to the size of an item.
+        """
+        item = self.codec_for(inflater)
+        key = (inflater, count, stride or item.size)
+        codec = self.cache.get(key)
+
+        if codec is None:
+            codec = ArrayCodec(item, count, stride)
+            self.cache[key] = codec
+
+        return codec
+
+    def _codec_for_inflater(self: CodecRegistry, inflater: type[obj] | Callable[[Resolver], obj]) -> Codec | None:
+        if isinstance(inflater, type):
+            for parent in inflater.__mro__:
+                for handler in self.type_handlers.get(parent, []):
+                    result = handler(inflater)
+
+                    if result is not None:
+                        return result
+        elif isinstance(getattr(inflater, "__self__", None), Field):
+            field = inflater.__self__
+
+            for handler in self.instance_handlers.get(field.__class__, []):
+                result = handler(field)
+
+                if result is not None:
+                    return result
+
+        return None
+
+    def register_type_handler(self: CodecRegistry, parent: type, handler: Callable[[type[obj]], Codec | None]) -> None:
+        """Register a codec handler for a type and its subclasses.
+
+        Args:
+            parent: The parent type.
+            handler: The handler for the type.
+        """
+        if parent not in self.type_handlers:
+            self.type_handlers[parent] = []
+
+        self.type_handlers[parent].append(handler)
+
+    def register_instance_handler(self: CodecRegistry, parent: type, handler: Callable[[Field], Codec | None]) -> None:
+        """Register a codec handler for the inflaters of a field class.
+
+        Args:
+            parent: The field class.
+            handler: The handler for the field.
+        """
+        if parent not in self.instance_handlers:
+            self.instance_handlers[parent] = []
+
+        self.instance_handlers[parent].append(handler)
@@ -9,4 +9,5 @@ from libdestruct.common.enum.enum_of import enum_of
 
 __all__ = ["enum", "enum_of"]
 
+import libdestruct.common.enum.enum_codec
 import libdestruct.common.enum.enum_field_inflater  # noqa: F401
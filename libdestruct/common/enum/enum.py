@@ -55,6 +55,9 @@ class enum(obj):
 
     def to_bytes(self: enum) -> bytes:
         """Return the serialized representation of the enum."""
+        if self._frozen:
+            return self._frozen_value.to_bytes(self.size, self.endianness, signed=self._backing_type.signed)
+
         return self._backing_type.to_bytes()
 
     def to_str(self: obj, indent: int = 0) -> str:
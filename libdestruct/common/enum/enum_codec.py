@@ -0,0 +1,22 @@
+#
+# This file is part of libdestruct (https://github.com/mrindeciso/libdestruct).
+# Copyright (c) 2024 Roberto Alessandro Bertolini. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+from __future__ import annotations
+
+from libdestruct.common.codec import Codec, CodecRegistry, PrimitiveCodec
+from libdestruct.common.codec.codec import integer_format
+from libdestruct.common.enum.int_enum_field import IntEnumField
+
+registry = CodecRegistry()
+
+
+def int_enum_codec(field: IntEnumField) -> Codec:
+    """Return the codec for an enum of integers, which decodes to a member of the Python enum."""
+    size = field.get_size()
+    return PrimitiveCodec(integer_format(size, field.backing_type.signed), size, field.enum, int)
+
+
+registry.register_instance_handler(IntEnumField, int_enum_codec)
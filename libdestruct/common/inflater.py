@@ -8,12 +8,15 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from libdestruct.backing.memory_layer import MemoryLayer
 from libdestruct.backing.memory_resolver import MemoryResolver
 from libdestruct.common.type_registry import TypeRegistry
 
 if TYPE_CHECKING:  # pragma: no cover
     from collections.abc import MutableSequence
 
+    from libdestruct.backing.identity_map import IdentityMap
+    from libdestruct.backing.memory_map import MemoryMap
     from libdestruct.backing.resolver import Resolver
     from libdestruct.common.obj import obj
 
@@ -21,11 +24,29 @@ if TYPE_CHECKING:  # pragma: no cover
 class Inflater:
     """The memory manager, which inflates any memory-referencing type."""
 
-    def __init__(self: Inflater, memory: MutableSequence) -> None:
-        """Initialize the memory manager."""
+    def __init__(
+        self: Inflater,
+        memory: MutableSequence,
+        memory_map: MemoryMap | None = None,
+        identity_map: IdentityMap | None = None,
+    ) -> None:
+        """Initialize the memory manager.
+
+        Args:
+            memory: The backing memory.
+            memory_map: The map of the valid regions of the memory. Defaults to the one of the memory layer, if any.
+            identity_map: The map of the objects already inflated, used to return the same object when the same type
+                is inflated twice at the same address, either directly or by unwrapping a pointer.
+        """
         self.memory = memory
         self.type_registry = TypeRegistry()
 
+        if memory_map is None and isinstance(memory, MemoryLayer):
+            memory_map = memory.memory_map
+
+        self.memory_map = memory_map
+        self.identity_map = identity_map
+
     def inflate(self: Inflater, item: type, address: int | Resolver) -> obj:
         """Inflate a memory-referencing type.
 
@@ -36,8 +57,31 @@ class Inflater:
         Returns:
             The inflated object.
         """
-        if isinstance(address, int):
-            # Create a memory resolver from the address
-            address = MemoryResolver(self.memory, address)
+        item_inflater = self.type_registry.inflater_for(item)
+
+        if not isinstance(address, int):
+            return item_inflater(address)
+
+        # Objects are keyed by their inflater, which is also the wrapper of the pointers to them
+        if self.identity_map is not None:
+            result = self.identity_map.get(item_inflater, address)
 
-        return self.type_registry.inflater_for(item)(address)
+            if result is not None:
+                return result
+
+        # Create a memory resolver from the address
+        result = item_inflater(MemoryResolver(self.memory, address, self.memory_map, self.identity_map))
+
+        if self.identity_map is not None:
+            self.identity_map.add(item_inflater, address, result)
+
+        return result
+
+    def invalidate(self: Inflater, address: int | None = None) -> None:
+        """Forget the objects inflated at the given address, or every object, so that they are inflated again.
+
+        Args:
+            address: The absolute address of the objects to forget. If not provided, every object is forgotten.
+        """
+        if self.identity_map is not None:
+            self.identity_map.invalidate(address)
@@ -41,6 +41,23 @@ class obj(ABC):
         """Return the address of the object in the memory view."""
         return self.resolver.resolve_address()
 
+    def rebase(self: obj, address: int) -> None:
+        """Move the object to a new address in the memory view.
+
+        Args:
+            address: The new address of the object.
+        """
+        self.resolver.rebase(address)
+        self.invalidate()
+
+        # Otherwise, inflating at the old address would return this object
+        if self.resolver.identity_map is not None:
+            self.resolver.identity_map.move(self, self.resolver.resolve_address())
+
+    def invalidate(self: obj) -> None:
+        """Refresh the cached address of the object, after its parent has been moved."""
+        self.resolver.invalidate()
+
     @abstractmethod
     def get(self: obj) -> object:
         """Return the value of the object."""
@@ -72,6 +89,15 @@ class obj(ABC):
         self._frozen_value = self.get()
         self._frozen = True
 
+    def _freeze_value(self: obj, value: object) -> None:
+        """Freeze the object to the given value, decoded from a read performed by its container.
+
+        Args:
+            value: The value of the object.
+        """
+        self._frozen_value = value
+        self._frozen = True
+
     def diff(self: obj) -> tuple[object, object]:
         """Return the difference between the current value and the frozen value."""
         try:
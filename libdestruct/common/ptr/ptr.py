@@ -10,6 +10,7 @@ from typing import TYPE_CHECKING
 
 from libdestruct.common.field import Field
 from libdestruct.common.obj import obj
+from libdestruct.common.utils import size_of
 
 if TYPE_CHECKING:  # pragma: no cover
     from libdestruct.backing.resolver import Resolver
@@ -41,7 +42,7 @@ class ptr(obj):
         if self._frozen:
             return self._frozen_value.to_bytes(self.size, self.endianness)
 
-        return self.resolver.resolve(self.size, 0)
+        return bytes(self.resolver.resolve(self.size, 0))
 
     def _set(self: ptr, value: int) -> None:
         """Set the value of the pointer to the given value."""
@@ -59,12 +60,27 @@ class ptr(obj):
             if length:
                 raise ValueError("Length is not supported when unwrapping a pointer to a wrapper object.")
 
-            return self.wrapper(self.resolver.absolute_from_own(address))
+            return self._unwrap_wrapper(address)
 
         if not length:
             length = 1
 
-        return self.resolver.resolve(length, 0)
+        return bytes(self.resolver.absolute_from_own(address).resolve(length, 0))
+
+    def _unwrap_wrapper(self: ptr, address: int) -> obj:
+        """Return the object pointed to by the pointer, reusing the one already inflated at its address if any."""
+        identity_map = self.resolver.identity_map
+
+        if identity_map is None:
+            return self.wrapper(self.resolver.absolute_from_own(address))
+
+        result = identity_map.get(self.wrapper, address)
+
+        if result is None:
+            result = self.wrapper(self.resolver.absolute_from_own(address))
+            identity_map.add(self.wrapper, address, result)
+
+        return result
 
     def try_unwrap(self: ptr, length: int | None = None) -> obj | None:
         """Return the object pointed to by the pointer, if it is valid.
@@ -73,15 +89,32 @@ class ptr(obj):
             length: The length of the object in memory this points to.
         """
         address = self.get()
+        size = length or self._target_size()
+
+        memory_map = self.resolver.memory_map
+
+        if memory_map is not None:
+            # We can validate the address without touching memory
+            return self.unwrap(length) if memory_map.is_mapped(address, size) else None
 
         try:
             # If the address is invalid, this will raise an IndexError or ValueError.
-            self.resolver.absolute_from_own(address).resolve(length)
+            self.resolver.absolute_from_own(address).resolve(size, 0)
         except (IndexError, ValueError):
             return None
 
         return self.unwrap(length)
 
+    def _target_size(self: ptr) -> int:
+        """Return the size of the object pointed to by the pointer, or 1 if it cannot be determined."""
+        if self.wrapper:
+            try:
+                return size_of(self.wrapper)
+            except ValueError:
+                pass
+
+        return 1
+
     def to_str(self: ptr, _: int = 0) -> str:
         """Return a string representation of the pointer."""
         if not self.wrapper:
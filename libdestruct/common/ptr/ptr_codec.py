@@ -0,0 +1,23 @@
+#
+# This file is part of libdestruct (https://github.com/mrindeciso/libdestruct).
+# Copyright (c) 2024 Roberto Alessandro Bertolini. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+from __future__ import annotations
+
+from libdestruct.common.codec import Codec, CodecRegistry, PrimitiveCodec
+from libdestruct.common.codec.codec import integer_format
+from libdestruct.common.ptr.ptr import ptr
+from libdestruct.common.ptr.ptr_field import PtrField
+
+registry = CodecRegistry()
+
+
+def ptr_codec(_: type[ptr] | PtrField) -> Codec:
+    """Return the codec for a pointer, which decodes to its address."""
+    return PrimitiveCodec(integer_format(ptr.size, signed=False), ptr.size)
+
+
+registry.register_type_handler(ptr, ptr_codec)
+registry.register_instance_handler(PtrField, ptr_codec)
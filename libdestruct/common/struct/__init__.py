@@ -10,5 +10,7 @@ from libdestruct.common.struct.struct_impl import struct_impl
 
 __all__ = ["struct", "struct_impl", "ptr_to", "ptr_to_self"]
 
+import libdestruct.common.ptr.ptr_codec
 import libdestruct.common.ptr.ptr_field_inflater
+import libdestruct.common.struct.struct_codec
 import libdestruct.common.struct.struct_inflater  # noqa: F401
@@ -0,0 +1,42 @@
+#
+# This file is part of libdestruct (https://github.com/mrindeciso/libdestruct).
+# Copyright (c) 2024 Roberto Alessandro Bertolini. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Callable
+
+    from libdestruct.backing.resolver import Resolver
+    from libdestruct.common.obj import obj
+    from libdestruct.common.struct.struct_impl import struct_impl
+
+
+class LazyMember:
+    """A descriptor which inflates a member of a lazy struct on first access."""
+
+    def __init__(self: LazyMember, name: str, offset: int, inflater: Callable[[Resolver], obj]) -> None:
+        """Initialize the descriptor.
+
+        Args:
+            name: The name of the member.
+            offset: The offset of the member in the struct.
+            inflater: The inflater for the member.
+        """
+        self.name = name
+        self.offset = offset
+        self.inflater = inflater
+
+    def __get__(self: LazyMember, instance: struct_impl | None, owner: type[struct_impl]) -> obj | LazyMember:
+        """Inflate the member, and store it in the instance so that the descriptor is bypassed from now on."""
+        if instance is None:
+            return self
+
+        member = self.inflater(instance.resolver.relative_from_own(self.offset, 0))
+        instance.__dict__[self.name] = member
+        instance._members[self.name] = member
+        return member
@@ -19,6 +19,21 @@ if TYPE_CHECKING:  # pragma: no cover
 class struct(obj):
     """A C struct."""
 
+    _lazy: bool = False
+    """Whether the members of the struct are inflated on first access, instead of on construction."""
+
+    def __init_subclass__(cls: type[struct], lazy: bool | None = None, **kwargs: ...) -> None:
+        """Configure a struct definition.
+
+        Args:
+            lazy: Whether the members of the struct are inflated on first access. Inherited if not provided.
+            **kwargs: The keyword arguments of the class definition.
+        """
+        super().__init_subclass__(**kwargs)
+
+        if lazy is not None:
+            cls._lazy = lazy
+
     def __init__(self: struct) -> None:
         """Initialize the struct."""
         raise RuntimeError("This type should not be directly instantiated.")
@@ -0,0 +1,24 @@
+#
+# This file is part of libdestruct (https://github.com/mrindeciso/libdestruct).
+# Copyright (c) 2024 Roberto Alessandro Bertolini. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+from __future__ import annotations
+
+from libdestruct.common.codec import Codec, CodecRegistry, StructCodec
+from libdestruct.common.struct.struct_impl import struct_impl
+
+registry = CodecRegistry()
+
+
+def struct_codec(item: type[struct_impl]) -> Codec | None:
+    """Return the codec for a struct, which decodes to a dict of the values of its members."""
+    if not hasattr(item, "_layout"):
+        return None
+
+    members = [(name, offset, registry.codec_for(inflater)) for name, offset, _, inflater in item._layout]
+    return StructCodec(members, item.size)
+
+
+registry.register_type_handler(struct_impl, struct_codec)
@@ -6,17 +6,27 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from typing_extensions import Self
 
 from libdestruct.backing.fake_resolver import FakeResolver
 from libdestruct.backing.resolver import Resolver
 from libdestruct.common.attributes.offset_attribute import OffsetAttribute
+from libdestruct.common.codec import CodecRegistry
 from libdestruct.common.field import Field
 from libdestruct.common.obj import obj
 from libdestruct.common.struct import struct
+from libdestruct.common.struct.lazy_member import LazyMember
 from libdestruct.common.type_registry import TypeRegistry
 from libdestruct.common.utils import iterate_annotation_chain, size_of
 
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Callable
+
+EAGER_MEMBER_NAMES = frozenset({"name", "resolver", "size", "_members"})
+"""The attributes set on every struct type or instance, which would hide the descriptor of a lazy member."""
+
 
 class struct_impl(struct):
     """The implementation for the C struct type."""
@@ -30,8 +40,21 @@ class struct_impl(struct):
     _inflater: TypeRegistry = TypeRegistry()
     """The type registry, used for inflating the attributes."""
 
+    _layout: list[tuple[str, int, int, Callable[[Resolver], obj]]]
+    """The compiled layout of the members, as (name, offset, size, inflater) tuples, shared by every instance."""
+
+    _eager_layout: list[tuple[str, int, int, Callable[[Resolver], obj]]]
+    """The part of the layout which is inflated on construction, i.e. all of it unless the struct is lazy."""
+
+    _frozen_bytes: bytes | None = None
+    """The raw memory of the struct read when it was frozen, including the padding between its members."""
+
     def __init__(self: struct_impl, resolver: Resolver | None = None, **kwargs: ...) -> None:
         """Initialize the struct implementation."""
+        # struct.__new__ returns an initialized instance, which Python then initializes again with the same arguments
+        if "resolver" in self.__dict__:
+            return
+
         # If we have kwargs and the resolver is None, we provide a fake resolver
         if kwargs and resolver is None:
             resolver = FakeResolver()
@@ -45,8 +68,7 @@ class struct_impl(struct):
         self.name = self.__class__.__name__
         self._members = {}
 
-        reference_type = self._reference_struct
-        self._inflate_struct_attributes(self._inflater, resolver, reference_type)
+        self._inflate_struct_attributes(resolver)
 
         for name, value in kwargs.items():
             getattr(self, name).value = value
@@ -57,60 +79,23 @@ class struct_impl(struct):
         # struct_impl -> struct -> obj becomes struct_impl -> obj
         return obj.__new__(cls)
 
-    def _inflate_struct_attributes(
-        self: struct_impl,
-        inflater: TypeRegistry,
-        resolver: Resolver,
-        reference_type: type,
-    ) -> None:
-        current_offset = 0
-
-        for name, annotation, reference in iterate_annotation_chain(reference_type, terminate_at=struct):
-            if name in reference.__dict__:
-                # Field associated with the annotation
-                attrs = getattr(reference, name)
-
-                # If attrs is not a tuple, we need to convert it to a tuple
-                if not isinstance(attrs, tuple):
-                    attrs = (attrs,)
-
-                # Assert that in all attributes, there is only one Field
-                if sum(isinstance(attr, Field) for attr in attrs) > 1:
-                    raise ValueError("Only one Field is allowed per attribute.")
-
-                resolved_type = None
-
-                for attr in attrs:
-                    if isinstance(attr, Field):
-                        resolved_type = inflater.inflater_for(
-                            (attr, annotation),
-                            owner=(self, reference_type._type_impl),
-                        )
-                    elif isinstance(attr, OffsetAttribute):
-                        offset = attr.offset
-                        if offset < current_offset:
-                            raise ValueError("Offset must be greater than the current size.")
-                        current_offset = offset
-                    else:
-                        raise TypeError("Only Field and OffsetAttribute are allowed in attributes.")
-
-                # If we don't have a Field, we need to inflate the type as if we have no attributes
-                if not resolved_type:
-                    resolved_type = inflater.inflater_for(annotation, owner=(self, reference_type._type_impl))
-            else:
-                resolved_type = inflater.inflater_for(annotation, owner=(self, reference_type._type_impl))
-
-            result = resolved_type(resolver.relative_from_own(current_offset, 0))
+    def _inflate_struct_attributes(self: struct_impl, resolver: Resolver) -> None:
+        """Inflate the members of the struct from the compiled layout of its type."""
+        for name, offset, _, member_inflater in self._eager_layout:
+            result = member_inflater(resolver.relative_from_own(offset, 0))
             setattr(self, name, result)
             self._members[name] = result
-            current_offset += size_of(result)
 
     @classmethod
     def compute_own_size(cls: type[struct_impl], reference_type: type) -> None:
-        """Compute the size of the struct."""
+        """Compute the size of the struct, and compile the layout of its members."""
+        layout = []
         size = 0
+        owner = (None, cls)
 
         for name, annotation, reference in iterate_annotation_chain(reference_type, terminate_at=struct):
+            member_inflater = None
+
             if name in reference.__dict__:
                 # Field associated with the annotation
                 attrs = getattr(reference, name)
@@ -123,11 +108,9 @@ class struct_impl(struct):
                 if sum(isinstance(attr, Field) for attr in attrs) > 1:
                     raise ValueError("Only one Field is allowed per attribute.")
 
-                attribute = None
-
                 for attr in attrs:
                     if isinstance(attr, Field):
-                        attribute = cls._inflater.inflater_for((attr, annotation))(None)
+                        member_inflater = cls._inflater.inflater_for((attr, annotation), owner=owner)
                     elif isinstance(attr, OffsetAttribute):
                         offset = attr.offset
                         if offset < size:
@@ -136,25 +119,67 @@ class struct_impl(struct):
                     else:
                         raise TypeError("Only Field and OffsetAttribute are allowed in attributes.")
 
-                # If we don't have a Field, we need to inflate the attribute as if we have no attributes
-                if not attribute:
-                    attribute = cls._inflater.inflater_for(annotation)
-            elif isinstance(annotation, Field):
-                attribute = cls._inflater.inflater_for((annotation, annotation.base_type))(None)
-            else:
-                attribute = cls._inflater.inflater_for(annotation)
+            # If we don't have a Field, we need to inflate the type as if we have no attributes
+            if not member_inflater:
+                member_inflater = cls._inflater.inflater_for(annotation, owner=owner)
 
-            size += size_of(attribute)
+            member_size = size_of(member_inflater)
+            layout.append((name, size, member_size, member_inflater))
+            size += member_size
 
+        cls._layout = layout
+        cls._eager_layout = cls._install_lazy_members(layout) if cls._lazy else layout
         cls.size = size
 
+    @classmethod
+    def _install_lazy_members(
+        cls: type[struct_impl],
+        layout: list[tuple[str, int, int, Callable[[Resolver], obj]]],
+    ) -> list[tuple[str, int, int, Callable[[Resolver], obj]]]:
+        """Install a descriptor for each member of a lazy struct, and return the members which must stay eager."""
+        eager_layout = []
+
+        for name, offset, member_size, member_inflater in layout:
+            if name in EAGER_MEMBER_NAMES or hasattr(struct_impl, name):
+                # A descriptor would shadow an attribute of the struct itself, or be hidden by one
+                eager_layout.append((name, offset, member_size, member_inflater))
+            else:
+                setattr(cls, name, LazyMember(name, offset, member_inflater))
+
+        return eager_layout
+
+    def _materialize(self: struct_impl) -> None:
+        """Inflate the members of a lazy struct which have not been accessed yet."""
+        if len(self._members) != len(self._layout):
+            self._members = {name: getattr(self, name) for name, _, _, _ in self._layout}
+
     def get(self: struct_impl) -> str:
         """Return the value of the struct."""
         return f"{self.name}(address={self.address}, size={size_of(self)})"
 
     def to_bytes(self: struct_impl) -> bytes:
         """Return the serialized representation of the struct."""
-        return b"".join(member.to_bytes() for member in self._members.values())
+        if not self._frozen:
+            return bytes(self.resolver.resolve(size_of(self), 0))
+
+        if self._frozen_bytes is not None:
+            return self._frozen_bytes
+
+        # Structs frozen by their container only have the values of their members, so padding is serialized as zeroes
+        data = bytearray(size_of(self))
+
+        for name, offset, size, _ in self._layout:
+            data[offset : offset + size] = self._members[name].to_bytes()
+
+        return bytes(data)
+
+    def to_dict(self: struct_impl) -> dict[str, object]:
+        """Return the values of the members of the struct, decoded from a single read of its memory.
+
+        Nested structs are returned as dicts, arrays as lists and pointers as their addresses.
+        """
+        data = self.to_bytes() if self._frozen else self.resolver.resolve(size_of(self), 0)
+        return CodecRegistry().codec_for(self.__class__).unpack(data, self.endianness)
 
     def _set(self: struct_impl, _: str) -> None:
         """Set the value of the struct to the given value."""
@@ -162,14 +187,41 @@ class struct_impl(struct):
 
     def freeze(self: struct_impl) -> None:
         """Freeze the struct."""
-        # The struct has no implicit value, but it must freeze its members
-        for member in self._members.values():
-            member.freeze()
+        # The struct has no implicit value, but it must freeze its members, which we decode from a single read
+        data = bytes(self.resolver.resolve(size_of(self), 0))
+        self._freeze_value(CodecRegistry().codec_for(self.__class__).unpack(data, self.endianness))
+        self._freeze_bytes(data)
+
+    def _freeze_bytes(self: struct_impl, data: bytes) -> None:
+        """Keep the raw memory read when the struct was frozen, and that of its nested structs."""
+        self._frozen_bytes = data
+
+        for name, offset, size, _ in self._layout:
+            member = self._members[name]
+
+            if isinstance(member, struct_impl):
+                member._freeze_bytes(data[offset : offset + size])
+
+    def _freeze_value(self: struct_impl, value: dict[str, object]) -> None:
+        """Freeze the members of the struct to the given values."""
+        self._materialize()
+
+        for name, member in self._members.items():
+            member._freeze_value(value[name])
 
         self._frozen = True
 
+    def invalidate(self: struct_impl) -> None:
+        """Refresh the cached addresses of the struct and of its members."""
+        self.resolver.invalidate()
+
+        # Members of lazy structs which were not accessed yet will be inflated at the new address
+        for member in self._members.values():
+            member.invalidate()
+
     def to_str(self: struct_impl, indent: int = 0) -> str:
         """Return a string representation of the struct."""
+        self._materialize()
         members = ",\n".join(
             [f"{' ' * (indent + 4)}{name}: {member.to_str(indent + 4)}" for name, member in self._members.items()],
         )
@@ -179,6 +231,7 @@ class struct_impl(struct):
 
     def __repr__(self: struct_impl) -> str:
         """Return a string representation of the struct."""
+        self._materialize()
         members = ",\n".join([f"{name}: {member}" for name, member in self._members.items()])
         return f"""{self.name} {{
     address: 0x{self.address:x},
@@ -188,6 +241,42 @@ class struct_impl(struct):
     }}
 }}"""
 
+    def _has_layout_of(self: struct_impl, other: struct_impl) -> bool:
+        """Return whether the struct has the same members, offsets and encodings as another one."""
+        if self.__class__ is other.__class__:
+            return True
+
+        registry = CodecRegistry()
+
+        return [(name, offset) for name, offset, _, _ in self._layout] == [
+            (name, offset) for name, offset, _, _ in other._layout
+        ] and registry.codec_for(self.__class__).format == registry.codec_for(other.__class__).format
+
+    def diff(self: struct_impl, other: struct_impl | None = None) -> dict[str, tuple[object, object]]:
+        """Return the members which differ between the frozen snapshot of the struct and its current value.
+
+        Args:
+            other: A struct with the same layout to compare against, instead of the current value.
+
+        Returns:
+            A mapping from the path of each differing primitive member, such as "a.b[3].c", to its (old, new) values.
+        """
+        if other is None:
+            if not self._frozen:
+                raise RuntimeError("Cannot diff a struct which is not frozen.")
+
+            new = self.resolver.resolve(size_of(self), 0)
+        elif self._has_layout_of(other):
+            new = other.to_bytes()
+        else:
+            raise ValueError("Cannot diff structs with different layouts.")
+
+        return CodecRegistry().codec_for(self.__class__).diff(self.to_bytes(), new, self.endianness)
+
+    def pdiff(self: struct_impl) -> str:
+        """Return a string representation of the members which changed since the struct was frozen."""
+        return "\n".join(f"{path}: {old} -> {new}" for path, (old, new) in self.diff().items())
+
     def __eq__(self: struct_impl, value: object) -> bool:
         """Return whether the struct is equal to the given value."""
         if not isinstance(value, struct_impl):
@@ -196,6 +285,14 @@ class struct_impl(struct):
         if size_of(self) != size_of(value):
             return False
 
+        if self._has_layout_of(value):
+            # Compare the serialized representations, ignoring the padding
+            codec = CodecRegistry().codec_for(self.__class__)
+            return next(codec.differing(self.to_bytes(), value.to_bytes()), None) is None
+
+        self._materialize()
+        value._materialize()
+
         if not self._members.keys() == value._members.keys():
             return False
 
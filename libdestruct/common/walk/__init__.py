@@ -0,0 +1,10 @@
+#
+# This file is part of libdestruct (https://github.com/mrindeciso/libdestruct).
+# Copyright (c) 2024 Roberto Alessandro Bertolini. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+from libdestruct.common.walk.explore import explore
+from libdestruct.common.walk.walk import walk
+
+__all__ = ["explore", "walk"]
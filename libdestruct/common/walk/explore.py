@@ -0,0 +1,128 @@
+#
+# This file is part of libdestruct (https://github.com/mrindeciso/libdestruct).
+# Copyright (c) 2024 Roberto Alessandro Bertolini. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from libdestruct.common.array.linear_array_field import LinearArrayField
+from libdestruct.common.codec import CodecRegistry
+from libdestruct.common.ptr.ptr import ptr
+from libdestruct.common.ptr.ptr_field import PtrField
+from libdestruct.common.struct.struct_impl import struct_impl
+from libdestruct.common.utils import size_of
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Generator, Iterable
+
+    from libdestruct.common.struct.struct import struct
+
+
+def explore(
+    root: struct_impl,
+    depth: int | None = None,
+    types: Iterable[type[struct]] | None = None,
+    follow: Iterable[type[struct]] | None = None,
+) -> Generator[struct_impl]:
+    """Explore the graph of structs reachable from a root struct through their pointers, in breadth-first order.
+
+    The pointers to structs of every node are followed, including those in nested structs, and every (address, type)
+    pair is visited once. The targets of each level of the graph are fetched with a single batched read, and the
+    yielded structs are frozen snapshots decoded from it. If the batched read fails, the targets are read one by one,
+    and those which cannot be read are skipped.
+
+    Args:
+        root: The struct to start from, which is yielded first as a frozen snapshot.
+        depth: The maximum number of pointers to follow from the root.
+        types: The types of the structs to yield. Structs of other types are still explored.
+        follow: The types of the structs which pointers are followed to. Defaults to every struct type.
+    """
+    types = None if types is None else tuple(types)
+    follow = None if follow is None else tuple(follow)
+
+    registry = CodecRegistry()
+    resolver = root.resolver
+    memory_map = resolver.memory_map
+
+    # The pointers followed in each struct type, as (offset, target type) pairs
+    pointers: dict[type[struct_impl], list[tuple[int, type[struct_impl]]]] = {}
+
+    def _is_valid(address: int, target: type[struct_impl]) -> bool:
+        return memory_map is None or memory_map.is_mapped(address, target.size)
+
+    frontier = [(root.address, root.__class__)]
+    visited = set(frontier)
+    level = 0
+
+    while frontier:
+        contents = resolver.try_resolve_many((address, item.size) for address, item in frontier)
+        next_frontier = []
+
+        for (address, item), data in zip(frontier, contents, strict=True):
+            if data is None or len(data) < item.size:
+                # The struct is not entirely readable
+                continue
+
+            node = item(resolver.absolute_from_own(address))
+            node._freeze_value(registry.codec_for(item).unpack(data, item.endianness))
+
+            if types is None or isinstance(node, types):
+                yield node
+
+            if depth is not None and level >= depth:
+                continue
+
+            if item not in pointers:
+                pointers[item] = [
+                    (offset, target)
+                    for offset, target in _pointers_of(item)
+                    if follow is None or issubclass(target, follow)
+                ]
+
+            for offset, target in pointers[item]:
+                target_address = int.from_bytes(data[offset : offset + ptr.size], item.endianness)
+
+                if target_address and (target_address, target) not in visited and _is_valid(target_address, target):
+                    visited.add((target_address, target))
+                    next_frontier.append((target_address, target))
+
+        frontier = next_frontier
+        level += 1
+
+
+def _pointers_of(inflater: object, base: int = 0) -> list[tuple[int, type[struct_impl]]]:
+    """Return the pointers to structs in the objects of an inflater, as (offset, target type) pairs.
+
+    Nested structs and arrays, including arrays of structs and tables of pointers, are searched as well.
+    """
+    field = getattr(inflater, "__self__", None)
+
+    if isinstance(field, PtrField):
+        target = field.backing_type
+
+        if isinstance(target, type) and issubclass(target, struct_impl):
+            return [(base, target)]
+
+        return []
+
+    if isinstance(field, LinearArrayField):
+        item_size = size_of(field.item)
+        item_pointers = _pointers_of(field.item)
+
+        return [
+            (base + index * item_size + offset, target)
+            for index in range(field.size)
+            for offset, target in item_pointers
+        ]
+
+    if isinstance(inflater, type) and issubclass(inflater, struct_impl):
+        return [
+            pointer
+            for _, offset, _, member_inflater in inflater._layout
+            for pointer in _pointers_of(member_inflater, base + offset)
+        ]
+
+    return []
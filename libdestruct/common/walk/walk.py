@@ -0,0 +1,122 @@
+#
+# This file is part of libdestruct (https://github.com/mrindeciso/libdestruct).
+# Copyright (c) 2024 Roberto Alessandro Bertolini. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from libdestruct.common.codec import CodecRegistry
+from libdestruct.common.ptr.ptr import ptr
+from libdestruct.common.utils import size_of
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Generator, Iterable, Iterator
+
+    from libdestruct.common.struct.struct_impl import struct_impl
+
+
+def walk(
+    head: struct_impl,
+    link: str,
+    limit: int | None = None,
+    fields: Iterable[str] | None = None,
+) -> Iterator[struct_impl] | Iterator[dict[str, object]]:
+    """Iterate over a linked list of structs, following the pointer stored in a member of each node.
+
+    A single cursor struct is inflated, and moved onto each node in turn. The cursor is only valid until the next
+    iteration, so it must be frozen or copied to be kept. The walk stops at a null pointer, at a pointer to unmapped
+    memory, at the first node which was already visited, or after `limit` nodes.
+
+    Args:
+        head: The first node of the list.
+        link: The name of the member pointing to the next node, such as a `ptr_to_self()` member.
+        limit: The maximum number of nodes to visit.
+        fields: The members to read from each node. If provided, each node is read once, over the span of these
+            members and of the link, and a dict of their values is yielded instead of the cursor.
+    """
+    layout = {name: (offset, size, inflater) for name, offset, size, inflater in head._layout}
+
+    if link not in layout:
+        raise ValueError(f"{head.name} has no member named {link}.")
+
+    if not isinstance(getattr(head, link), ptr):
+        raise TypeError(f"The member {link} of {head.name} is not a pointer.")
+
+    if fields is None:
+        return _walk_nodes(head, link, limit)
+
+    fields = list(fields)
+
+    for name in fields:
+        if name not in layout:
+            raise ValueError(f"{head.name} has no member named {name}.")
+
+    return _walk_fields(head, link, fields, limit, {name: layout[name] for name in {link, *fields}})
+
+
+def _addresses(head: struct_impl, limit: int | None) -> Generator[int, int]:
+    """Yield the addresses of the nodes of a list, receiving the address of the next node after each one."""
+    memory_map = head.resolver.memory_map
+    node_size = size_of(head)
+    visited = set()
+    address = head.address
+
+    while address and address not in visited and (limit is None or len(visited) < limit):
+        if memory_map is not None and not memory_map.is_mapped(address, node_size):
+            return
+
+        visited.add(address)
+        address = yield address
+
+
+def _walk_nodes(head: struct_impl, link: str, limit: int | None) -> Generator[struct_impl]:
+    """Yield a cursor struct moved onto each node of a list."""
+    cursor = head.__class__(head.resolver.absolute_from_own(head.address))
+    addresses = _addresses(head, limit)
+    address = next(addresses, None)
+
+    while address is not None:
+        cursor.rebase(address)
+        yield cursor
+
+        # The link is read after the caller is done with the node, so that it sees any change made to it
+        address = _send(addresses, getattr(cursor, link).get())
+
+
+def _walk_fields(
+    head: struct_impl,
+    link: str,
+    fields: list[str],
+    limit: int | None,
+    members: dict[str, tuple[int, int, object]],
+) -> Generator[dict[str, object]]:
+    """Yield the values of the given members of each node of a list, decoded from a single read per node."""
+    registry = CodecRegistry()
+    start = min(offset for offset, _, _ in members.values())
+    end = max(offset + size for offset, size, _ in members.values())
+    codecs = {name: (offset - start, registry.codec_for(inflater)) for name, (offset, _, inflater) in members.items()}
+    link_offset, link_codec = codecs[link]
+
+    # Every node is read through the same resolver, moved onto the span of the members of the node
+    reader = head.resolver.absolute_from_own(head.address + start)
+    addresses = _addresses(head, limit)
+    address = next(addresses, None)
+
+    while address is not None:
+        reader.rebase(address + start)
+        data = reader.resolve(end - start, 0)
+
+        yield {name: codecs[name][1].unpack(data, head.endianness, codecs[name][0]) for name in fields}
+
+        address = _send(addresses, link_codec.unpack(data, head.endianness, link_offset))
+
+
+def _send(addresses: Generator[int, int], address: int) -> int | None:
+    """Send the address of the next node to the generator of addresses, returning None when the walk is over."""
+    try:
+        return addresses.send(address)
+    except StopIteration:
+        return None
@@ -10,18 +10,34 @@ from collections.abc import Sequence
 from typing import TYPE_CHECKING
 
 from libdestruct.backing.resolver import Resolver
+from libdestruct.common.codec import CodecRegistry, codec_dtype
 from libdestruct.common.inflater import Inflater
+from libdestruct.common.type_registry import TypeRegistry
 
 if TYPE_CHECKING:  # pragma: no cover
+    import numpy as np
+
+    from libdestruct.backing.identity_map import IdentityMap
+    from libdestruct.backing.memory_map import MemoryMap
     from libdestruct.common.obj import obj
 
 
-def inflater(memory: Sequence) -> Inflater:
-    """Return a TypeInflater instance."""
+def inflater(
+    memory: Sequence,
+    memory_map: MemoryMap | None = None,
+    identity_map: IdentityMap | None = None,
+) -> Inflater:
+    """Return a TypeInflater instance.
+
+    Args:
+        memory: The memory view, which can be mutable or immutable.
+        memory_map: The map of the valid regions of the memory view, used to reject invalid pointers.
+        identity_map: The map of the objects already inflated, used to inflate each type once per address.
+    """
     if not isinstance(memory, Sequence):
         raise TypeError(f"memory must be a MutableSequence, not {type(memory).__name__}")
 
-    return Inflater(memory)
+    return Inflater(memory, memory_map, identity_map)
 
 
 def inflate(item: type, memory: Sequence, address: int | Resolver) -> obj:
@@ -39,3 +55,15 @@ def inflate(item: type, memory: Sequence, address: int | Resolver) -> obj:
         raise TypeError(f"address must be an int or a Resolver, not {type(address).__name__}")
 
     return inflater(memory).inflate(item, address)
+
+
+def dtype_of(item: type) -> np.dtype:
+    """Return the NumPy dtype with the same memory layout as a type.
+
+    Nested structs become structured fields, arrays become subarrays and pointers become unsigned 64-bit integers.
+
+    Args:
+        item: The type, such as a struct or a field like `array_of(c_int, 4)`.
+    """
+    item_inflater = TypeRegistry().inflater_for(item)
+    return codec_dtype(CodecRegistry().codec_for(item_inflater), getattr(item_inflater, "endianness", "little"))
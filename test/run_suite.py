@@ -13,7 +13,13 @@ from scripts.basic_test import BasicTest
 from scripts.basic_struct_test import BasicStructTest
 from scripts.ctypes_test import CtypesTest
 from scripts.enum_test import EnumTest
+from scripts.mapped_memory_test import MappedMemoryTest
+from scripts.page_cache_test import PageCacheTest
+from scripts.process_memory_test import ProcessMemoryTest
+from scripts.resolver_test import ResolverTest
 from scripts.string_test import StringTest
+from scripts.walk_test import WalkTest
+from scripts.write_buffer_test import WriteBufferTest
 
 def test_suite():
     suite = TestSuite()
@@ -23,7 +29,13 @@ def test_suite():
     suite.addTest(TestLoader().loadTestsFromTestCase(BasicStructTest))
     suite.addTest(TestLoader().loadTestsFromTestCase(CtypesTest))
     suite.addTest(TestLoader().loadTestsFromTestCase(EnumTest))
+    suite.addTest(TestLoader().loadTestsFromTestCase(MappedMemoryTest))
+    suite.addTest(TestLoader().loadTestsFromTestCase(PageCacheTest))
+    suite.addTest(TestLoader().loadTestsFromTestCase(ProcessMemoryTest))
+    suite.addTest(TestLoader().loadTestsFromTestCase(ResolverTest))
     suite.addTest(TestLoader().loadTestsFromTestCase(StringTest))
+    suite.addTest(TestLoader().loadTestsFromTestCase(WalkTest))
+    suite.addTest(TestLoader().loadTestsFromTestCase(WriteBufferTest))
 
     return suite
 
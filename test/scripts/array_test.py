@@ -6,8 +6,16 @@
 
 import unittest
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 from libdebug import debugger
-from libdestruct import array, array_of, inflater, c_int, c_long, struct
+from libdestruct import array, array_of, dtype_of, inflater, c_int, c_long, c_uint, offset, ptr, ptr_to, ptr_to_self, struct
+from libdestruct.backing.memory_map import MemoryMap
+
+from scripts.page_cache_test import CountingMemory, StrictMemory
 
 class ArrayTest(unittest.TestCase):
     def test_linear_arrays_1(self):
@@ -80,3 +88,332 @@ class ArrayTest(unittest.TestCase):
 
         d.kill()
         d.terminate()
+
+    def test_array_freeze(self):
+        class test_t(struct):
+            a: c_int
+            b: array = array_of(c_long, 4096)
+
+        memory = CountingMemory(4 + 8 * 4096)
+        memory.data[0:4] = (1337).to_bytes(4, "little")
+        memory.data[4:] = b"".join(i.to_bytes(8, "little") for i in range(4096))
+
+        test = inflater(memory).inflate(test_t, 0)
+
+        # Both the struct and the array are serialized and frozen with a single read
+        memory.reads = 0
+        self.assertEqual(test.to_bytes(), bytes(memory.data))
+        self.assertEqual(test.b.to_bytes(), bytes(memory.data[4:]))
+        self.assertEqual(memory.reads, 2)
+
+        memory.reads = 0
+        test.freeze()
+        self.assertEqual(memory.reads, 1)
+
+        memory.data[0:4] = (0).to_bytes(4, "little")
+        memory.data[4:12] = (0xdeadbeef).to_bytes(8, "little")
+
+        memory.reads = 0
+        self.assertEqual(test.a.value, 1337)
+        self.assertEqual(test.b[0].value, 0)
+        self.assertEqual(test.b[4095].value, 4095)
+        self.assertEqual(test.b.value[:3], [0, 1, 2])
+        self.assertEqual(test.to_bytes()[:12], (1337).to_bytes(4, "little") + (0).to_bytes(8, "little"))
+        self.assertEqual(memory.reads, 0)
+
+        # The frozen array can be compared with, and updated from, a single read
+        memory.reads = 0
+        old, new = test.b.diff()
+        self.assertEqual((old[:2], new[:2]), ([0, 1], [0xdeadbeef, 1]))
+        self.assertEqual(test.b.pdiff(), "[0]: 0 -> 3735928559")
+        self.assertEqual(memory.reads, 2)
+
+        test.b.update()
+        self.assertEqual(test.b[0].value, 0xdeadbeef)
+        self.assertEqual(test.b.pdiff(), "")
+
+        with self.assertRaises(RuntimeError):
+            inflater(memory).inflate(array_of(c_int, 2), 0).diff()
+
+        # Standalone arrays of structs can be frozen as well
+        points = inflater(memory).inflate(array_of(test_t, 1), 0)
+        points.freeze()
+        memory.data[0:4] = (1).to_bytes(4, "little")
+        self.assertEqual(points[0].a.value, 0)
+        self.assertEqual(points[0].b[0].value, 0xdeadbeef)
+        self.assertEqual(bytes(points)[:4], bytes(4))
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_array_to_numpy(self):
+        class point_t(struct):
+            x: c_int
+            y: c_long = offset(8)
+
+        class test_t(struct):
+            a: c_int
+            b: array = array_of(point_t, 2)
+            c: ptr = ptr_to_self()
+
+        dtype = dtype_of(test_t)
+
+        self.assertEqual(dtype.itemsize, 4 + 2 * 16 + 8)
+        self.assertEqual(dtype.names, ("a", "b", "c"))
+        self.assertEqual(dtype.fields["b"][1], 4)
+        self.assertEqual(dtype["b"].shape, (2,))
+        self.assertEqual(dtype["b"].base["y"], numpy.dtype("<i8"))
+        self.assertEqual(dtype["c"], numpy.dtype("<u8"))
+
+        memory = bytearray(dtype.itemsize * 100)
+        lib = inflater(memory)
+
+        for i in range(100):
+            lib.inflate(test_t, i * dtype.itemsize).a.value = i
+
+        test = lib.inflate(array_of(test_t, 100), 0)
+        values = test.to_numpy()
+
+        self.assertEqual(values.dtype, dtype)
+        self.assertEqual(values["a"].tolist(), list(range(100)))
+
+        # Views over a bytearray are zero-copy
+        values["b"][3, 1]["y"] = 1337
+        self.assertEqual(test[3].b[1].y.value, 1337)
+
+        integers = lib.inflate(array_of(c_int, 4), 0).to_numpy()
+        self.assertEqual(integers.tolist(), [0, 0, 0, 0])
+
+    def test_array_values(self):
+        class test_t(struct):
+            a: c_int
+            b: c_long
+
+        memory = CountingMemory(8 * 1000 + 12 * 2)
+        memory.data[: 8 * 1000] = b"".join((i - 500).to_bytes(8, "little", signed=True) for i in range(1000))
+        lib = inflater(memory)
+
+        test = lib.inflate(array_of(c_long, 1000), 0)
+
+        memory.reads = 0
+        self.assertEqual(test.values(), list(range(-500, 500)))
+        self.assertEqual(test.tolist(), list(range(-500, 500)))
+        self.assertEqual(memory.reads, 2)
+
+        unsigned = lib.inflate(array_of(c_uint, 2), 0)
+        self.assertEqual(unsigned.values(), [2**32 - 500, 2**32 - 1])
+
+        structs = lib.inflate(array_of(test_t, 2), 8 * 1000)
+        structs[1].a.value = 1337
+        self.assertEqual(structs.values(), [{"a": 0, "b": 0}, {"a": 1337, "b": 0}])
+
+        test.freeze()
+        memory.data[:8] = bytes(8)
+        self.assertEqual(test.values()[0], -500)
+
+    def test_array_slices(self):
+        memory = CountingMemory(4 * 1000)
+        memory.data[:] = b"".join(i.to_bytes(4, "little") for i in range(1000))
+        test = inflater(memory).inflate(array_of(c_int, 1000), 0)
+
+        view = test[100:200]
+        self.assertEqual(len(view), 100)
+        self.assertEqual(view.address, 400)
+        self.assertEqual(view[0].value, 100)
+
+        memory.reads = 0
+        self.assertEqual(view.values(), list(range(100, 200)))
+        self.assertEqual(memory.reads, 1)
+
+        strided = test[10:50:7]
+        self.assertEqual(len(strided), len(range(10, 50, 7)))
+        self.assertEqual([x.value for x in strided], list(range(10, 50, 7)))
+        self.assertEqual(strided.values(), list(range(10, 50, 7)))
+        self.assertEqual(strided[1:].values(), list(range(17, 50, 7)))
+        self.assertEqual(strided[::2].values(), list(range(10, 50, 14)))
+        self.assertEqual(strided.to_bytes(), b"".join(i.to_bytes(4, "little") for i in range(10, 50, 7)))
+        self.assertEqual(test[-3:].values(), [997, 998, 999])
+        self.assertEqual(test[5:5].values(), [])
+
+        if numpy is not None:
+            self.assertEqual(strided.to_numpy().tolist(), list(range(10, 50, 7)))
+
+        memory.reads = 0
+        chunks = [chunk.values() for chunk in test.chunks(300)]
+        self.assertEqual([len(chunk) for chunk in chunks], [300, 300, 300, 100])
+        self.assertEqual(sum(chunks, []), list(range(1000)))
+        self.assertEqual(memory.reads, 4)
+
+        strided.freeze()
+        memory.data[68:72] = bytes(4)
+        self.assertEqual(strided[1].value, 17)
+        self.assertEqual(strided[1:3].values(), [17, 24])
+        self.assertEqual(test[17].value, 0)
+
+        with self.assertRaises(ValueError):
+            test[::-1]
+
+    def test_array_search(self):
+        class test_t(struct):
+            a: c_int
+            b: c_long
+
+        memory = bytearray(12 * 100)
+        lib = inflater(memory)
+        test = lib.inflate(array_of(test_t, 100), 0)
+
+        for i in range(100):
+            test[i].a.value = i % 10
+            test[i].b.value = i * 1000
+
+        self.assertEqual(test.find(7, field="a"), 7)
+        self.assertEqual(test.find(7, field="a", start=8), 17)
+        self.assertEqual(test.find(42000, field="b"), 42)
+        self.assertEqual(test.find(11, field="a"), -1)
+        self.assertEqual(test.count_of(3, field="a"), 10)
+        self.assertEqual(test.index({"a": 5, "b": 55000}), 55)
+        self.assertIn(test[55], test)
+
+        with self.assertRaises(ValueError):
+            test.index(11, field="a")
+
+        with self.assertRaises(ValueError):
+            test.find(1, field="c")
+
+        # Matches which are not aligned to an item are skipped
+        integers = inflater(bytes([0, 1, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0])).inflate(array_of(c_int, 3), 0)
+        self.assertEqual(integers.find(1), 2)
+        self.assertEqual(integers.count_of(1), 1)
+        self.assertIn(256, integers)
+        self.assertNotIn(65536, integers)
+        self.assertNotIn(2**40, integers)
+
+        # Strided views search the selected items only
+        self.assertEqual(test[::3].find(9, field="a", start=1), 3)
+        self.assertEqual(test[1::3].count_of(0, field="a"), 3)
+
+    def test_array_assignment(self):
+        memory = CountingMemory(4 * 1000)
+        test = inflater(memory).inflate(array_of(c_int, 1000), 0)
+
+        test[:] = range(1000)
+        self.assertEqual(memory.writes, 1)
+        self.assertEqual(test.values(), list(range(1000)))
+
+        test[-1] = -1
+        test[10:20:2] = [0] * 5
+        self.assertEqual(test[999].value, -1)
+        self.assertEqual(test[10:20].values(), [0, 11, 0, 13, 0, 15, 0, 17, 0, 19])
+
+        memory.writes = 0
+        test.fill(7)
+        test[::2].fill(8)
+        test.set([1] * 1000)
+        test[:2].write_bytes(bytes(8))
+        self.assertEqual(memory.writes, 4)
+        self.assertEqual(test[:3].values(), [0, 0, 1])
+
+        with self.assertRaises(ValueError):
+            test[:3] = [1, 2]
+
+        with self.assertRaises(ValueError):
+            test.write_bytes(bytes(3))
+
+        with self.assertRaises(IndexError):
+            test[1000] = 0
+
+        # Reads and writes agree on negative indices and bounds
+        test[-2] = 42
+        self.assertEqual(test[-2].value, 42)
+        self.assertEqual(test[-2].address, test[998].address)
+
+        with self.assertRaises(IndexError):
+            test[1000]
+
+        with self.assertRaises(IndexError):
+            test[-1001]
+
+        # Items of aggregate types can be copied from objects of the same size
+        class test_t(struct):
+            a: c_int
+            b: c_long
+
+        structs = inflater(bytearray(12 * 3)).inflate(array_of(test_t, 3), 0)
+        structs[0].b.value = 1337
+        structs[1:] = [structs[0], structs[0]]
+        self.assertEqual(structs[2].b.value, 1337)
+
+        # Or from their values, as returned by values()
+        memory = CountingMemory(12 * 3)
+        structs = inflater(memory).inflate(array_of(test_t, 3), 0)
+        structs[:] = [{"a": i, "b": i * 10} for i in range(3)]
+        structs[1] = {"a": -1, "b": -10}
+        self.assertEqual(structs.values(), [{"a": 0, "b": 0}, {"a": -1, "b": -10}, {"a": 2, "b": 20}])
+        self.assertEqual(memory.writes, 2)
+
+        nested = inflater(bytearray(4 * 6)).inflate(array_of(array_of(c_int, 2), 3), 0)
+        nested.fill([1, 2])
+        nested[2] = (3, 4)
+        self.assertEqual(nested.values(), [[1, 2], [1, 2], [3, 4]])
+
+        with self.assertRaises(NotImplementedError):
+            structs.fill(0)
+
+        with self.assertRaises(NotImplementedError):
+            nested[0] = 1
+
+        test.freeze()
+
+        with self.assertRaises(ValueError):
+            test[0] = 1
+
+        with self.assertRaises(ValueError):
+            test.fill(1)
+
+    def test_unwrap_all(self):
+        class bucket_t(struct):
+            key: c_long
+            hits: c_int
+
+        memory = CountingMemory(0x1000)
+
+        # Two adjacent buckets, a distant one, a null pointer, a pointer out of the map and a repeated bucket
+        buckets = {0x200: (1, 10), 0x20C: (2, 20), 0x600: (3, 30)}
+
+        for address, (key, hits) in buckets.items():
+            memory.data[address : address + 12] = key.to_bytes(8, "little") + hits.to_bytes(4, "little")
+
+        table = [0x200, 0, 0x600, 0x20C, 0x2000, 0x200]
+        memory.data[0 : 8 * len(table)] = b"".join(address.to_bytes(8, "little") for address in table)
+
+        lib = inflater(memory, MemoryMap([(0, 0x1000, "rw-p", "")]))
+        test = lib.inflate(array_of(ptr_to(bucket_t), len(table)), 0)
+
+        # One read for the pointers, and one for each run of adjacent buckets
+        memory.reads = 0
+        targets = test.unwrap_all()
+        self.assertEqual(memory.reads, 3)
+
+        self.assertEqual([target and target.address for target in targets], [0x200, None, 0x600, 0x20C, None, 0x200])
+        self.assertEqual([target and target.key.value for target in targets], [1, None, 3, 2, None, 1])
+        self.assertEqual(targets[3].hits.value, 20)
+        self.assertEqual(targets[0].to_dict(), {"key": 1, "hits": 10})
+
+        # The targets are frozen snapshots
+        memory.data[0x600:0x608] = (4).to_bytes(8, "little")
+        self.assertEqual(targets[2].key.value, 3)
+        self.assertEqual(test[2].unwrap().key.value, 4)
+
+        integers = lib.inflate(array_of(ptr_to(c_int), 2), 0x40)
+        memory.data[0x40:0x50] = (0x600).to_bytes(8, "little") + (0x208).to_bytes(8, "little")
+        self.assertEqual([target.value for target in integers.unwrap_all()], [4, 10])
+
+        self.assertEqual(lib.inflate(array_of(ptr_to(c_int), 0), 0).unwrap_all(), [])
+
+        with self.assertRaises(TypeError):
+            lib.inflate(array_of(c_long, 2), 0).unwrap_all()
+
+        # Without a memory map, a garbage pointer does not fail the other targets
+        strict = StrictMemory(0x1000)
+        strict.data[:] = memory.data
+        strict.data[0x20:0x28] = (0xDEADBEEF).to_bytes(8, "little")
+        targets = inflater(strict).inflate(array_of(ptr_to(bucket_t), len(table)), 0).unwrap_all()
+        self.assertEqual([target and target.key.value for target in targets], [1, None, 4, 2, None, 1])
@@ -5,9 +5,10 @@
 #
 
 import unittest
+from enum import IntEnum
 
 from libdebug import debugger
-from libdestruct import inflater, c_int, c_long, c_uint, c_ulong, struct, ptr, ptr_to, ptr_to_self
+from libdestruct import array, array_of, enum, enum_of, inflater, c_int, c_long, c_uint, c_ulong, offset, struct, ptr, ptr_to, ptr_to_self
 
 class BasicStructTest(unittest.TestCase):
     def test_simple_struct(self):
@@ -368,3 +369,193 @@ class BasicStructTest(unittest.TestCase):
         self.assertEqual(test2.size.address, 0x0)
         self.assertEqual(test2.a.value, 0xdeadbeef)
         self.assertEqual(test2.address, 0x0)
+
+    def test_struct_layout(self):
+        class test_t(struct):
+            a: c_int
+            b: c_long = offset(8)
+            c: array = array_of(c_int, 3)
+            d: ptr = ptr_to_self()
+
+        memory = b""
+        memory += (1337).to_bytes(8, "little")
+        memory += (13371337).to_bytes(8, "little")
+        memory += b"".join(i.to_bytes(4, "little") for i in range(3))
+        memory += (0).to_bytes(8, "little")
+        memory *= 2
+
+        lib = inflater(memory)
+        first = lib.inflate(test_t, 0)
+        second = lib.inflate(test_t, 36)
+
+        # The layout is compiled once per type and shared by every instance
+        self.assertIs(first._layout, second._layout)
+        self.assertEqual(
+            [(name, offset, size) for name, offset, size, _ in first._layout],
+            [("a", 0, 4), ("b", 8, 8), ("c", 16, 12), ("d", 28, 8)],
+        )
+        self.assertEqual(first.size, 36)
+
+        self.assertEqual(second.a.value, 1337)
+        self.assertEqual(second.b.value, 13371337)
+        self.assertEqual(second.c[2].value, 2)
+        self.assertEqual(second.c.address, 36 + 16)
+        self.assertEqual(second.d.address, 36 + 28)
+
+    def test_lazy_struct_reserved_names(self):
+        class test_t(struct, lazy=True):
+            name: c_int
+            val: c_long
+
+        memory = (7).to_bytes(4, "little") + (1337).to_bytes(8, "little")
+        test = inflater(memory).inflate(test_t, 0)
+
+        # A member named like an instance attribute of the struct stays eager, as it would otherwise be hidden
+        self.assertEqual(test.name.value, 7)
+        self.assertEqual(list(test._members), ["name"])
+        self.assertIn("name: 7", test.to_str())
+        self.assertEqual(test.val.value, 1337)
+
+    def test_lazy_struct(self):
+        class test_t(struct, lazy=True):
+            a: c_int
+            b: c_long
+            c: array = array_of(c_int, 2)
+            d: ptr = ptr_to_self()
+
+        class test_eager_t(struct):
+            a: c_int
+            b: c_long
+            c: array = array_of(c_int, 2)
+            d: ptr = ptr_to_self()
+
+        memory = bytearray()
+        memory += (1337).to_bytes(4, "little")
+        memory += (13371337).to_bytes(8, "little")
+        memory += (1).to_bytes(4, "little") + (2).to_bytes(4, "little")
+        memory += (0).to_bytes(8, "little")
+
+        lib = inflater(memory)
+        test = lib.inflate(test_t, 0)
+        eager = lib.inflate(test_eager_t, 0)
+
+        # Nothing is inflated until it is accessed
+        self.assertEqual(test._members, {})
+        self.assertEqual(test.b.value, 13371337)
+        self.assertEqual(list(test._members), ["b"])
+        self.assertIs(test.b, test._members["b"])
+
+        # Whole-struct operations see every member, in declaration order
+        self.assertEqual(test.to_bytes(), eager.to_bytes())
+        self.assertEqual(test.to_str(), eager.to_str().replace("test_eager_t", "test_t"))
+        self.assertEqual(list(test._members), ["a", "b", "c", "d"])
+        self.assertEqual(test.c[1].value, 2)
+
+        class test_scalar_t(struct, lazy=True):
+            a: c_int
+            b: c_long
+
+        frozen = lib.inflate(test_scalar_t, 0)
+        frozen.freeze()
+        memory[0:4] = (1234).to_bytes(4, "little")
+        self.assertEqual(frozen.a.value, 1337)
+        self.assertEqual(test.a.value, 1234)
+
+        # Subclasses inherit the laziness of their parent
+        class test_child_t(test_t):
+            e: c_int
+
+        child = test_child_t(a=1, e=2)
+        self.assertEqual(list(child._members), ["a", "e"])
+        self.assertEqual(child.to_bytes()[:4], (1).to_bytes(4, "little"))
+
+    def test_struct_to_dict(self):
+        class color(IntEnum):
+            RED = 0
+            GREEN = 1
+
+        class point_t(struct):
+            x: c_int
+            y: c_int
+
+        class test_t(struct):
+            a: c_int
+            b: c_long = offset(8)
+            c: enum = enum_of(color)
+            d: array = array_of(point_t, 2)
+            e: ptr = ptr_to_self()
+
+        memory = bytearray()
+        memory += (-1).to_bytes(4, "little", signed=True)
+        memory += bytes(4)
+        memory += (13371337).to_bytes(8, "little")
+        memory += (1).to_bytes(4, "little")
+        memory += b"".join(i.to_bytes(4, "little") for i in range(4))
+        memory += (0xdeadbeef).to_bytes(8, "little")
+
+        test = inflater(memory).inflate(test_t, 0)
+
+        expected = {
+            "a": -1,
+            "b": 13371337,
+            "c": color.GREEN,
+            "d": [{"x": 0, "y": 1}, {"x": 2, "y": 3}],
+            "e": 0xdeadbeef,
+        }
+        self.assertEqual(test.to_dict(), expected)
+        self.assertEqual(test.d[1].to_dict(), {"x": 2, "y": 3})
+
+        # A frozen struct returns its frozen values
+        point = inflater(memory).inflate(point_t, 28)
+        point.freeze()
+        memory[28:32] = (1234).to_bytes(4, "little")
+        self.assertEqual(point.to_dict(), {"x": 2, "y": 3})
+        self.assertEqual(test.to_dict()["d"][1], {"x": 1234, "y": 3})
+
+        # Freezing keeps the padding and the offset gaps as they were in memory
+        class outer_t(struct):
+            inner: test_t
+
+        memory[4:8] = b"\xaa\xbb\xcc\xdd"
+        outer = inflater(memory).inflate(outer_t, 0)
+        before = bytes(outer)
+        outer.freeze()
+        memory[4:8] = bytes(4)
+        self.assertEqual(bytes(outer), before)
+        self.assertEqual(bytes(outer.inner)[4:8], b"\xaa\xbb\xcc\xdd")
+
+    def test_struct_diff(self):
+        class inner_t(struct):
+            c: c_int
+            d: c_int
+
+        class test_t(struct):
+            a: c_long
+            b: array = array_of(inner_t, 64)
+            e: c_int = offset(8 + 8 * 64 + 4)
+
+        memory = bytearray(8 + 8 * 64 + 8)
+        lib = inflater(memory)
+
+        test = lib.inflate(test_t, 0)
+        test.freeze()
+
+        memory[8 + 8 * 3 + 4 : 8 + 8 * 3 + 8] = (1337).to_bytes(4, "little")
+        memory[8 + 8 * 63 : 8 + 8 * 63 + 4] = (-1).to_bytes(4, "little", signed=True)
+        # Padding is not part of any member
+        memory[8 + 8 * 64] = 0xFF
+
+        self.assertEqual(test.diff(), {"b[3].d": (0, 1337), "b[63].c": (0, -1)})
+        self.assertEqual(test.pdiff(), "b[3].d: 0 -> 1337\nb[63].c: 0 -> -1")
+
+        other = lib.inflate(test_t, 0)
+        self.assertNotEqual(test, other)
+        self.assertEqual(other.diff(test), {"b[3].d": (1337, 0), "b[63].c": (-1, 0)})
+
+        memory[8 + 8 * 3 + 4 : 8 + 8 * 3 + 8] = bytes(4)
+        memory[8 + 8 * 63 : 8 + 8 * 63 + 4] = bytes(4)
+        self.assertEqual(test, other)
+        self.assertEqual(test.diff(), {})
+
+        with self.assertRaises(RuntimeError):
+            other.diff()
@@ -0,0 +1,157 @@
+#
+# This file is part of libdestruct (https://github.com/mrindeciso/libdestruct).
+# Copyright (c) 2024 Roberto Alessandro Bertolini. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+import struct as struct_module
+import tempfile
+import unittest
+
+from libdestruct import inflater, c_int, c_long, ptr, ptr_to, struct
+from libdestruct.backing.elf_core import ElfCore
+from libdestruct.backing.mapped_memory import MappedMemory
+
+class MappedMemoryTest(unittest.TestCase):
+    def setUp(self):
+        self.file = tempfile.NamedTemporaryFile()
+        self.addCleanup(self.file.close)
+
+    def test_segments(self):
+        class node_t(struct):
+            a: c_int
+            b: c_int
+
+        class root_t(struct):
+            data: c_long
+            node: ptr = ptr_to(node_t)
+
+        data = bytearray(0x2000)
+        # root_t at 0x400000, stored at file offset 0x10
+        data[0x10:0x18] = (0x1337).to_bytes(8, "little")
+        data[0x18:0x20] = (0x7FFF0008).to_bytes(8, "little")
+        # node_t at 0x7fff0008, stored at file offset 0x1008
+        data[0x1008:0x100C] = (1).to_bytes(4, "little")
+        data[0x100C:0x1010] = (2).to_bytes(4, "little")
+
+        self.file.write(data)
+        self.file.flush()
+
+        with MappedMemory(self.file.name, [(0x7FFF0000, 0x1000, 0x1000), (0x400000, 0x1000, 0)]) as memory:
+            libdestruct = inflater(memory)
+
+            root = libdestruct.inflate(root_t, 0x400010)
+
+            self.assertEqual(root.data.value, 0x1337)
+            self.assertEqual(root.node.unwrap().a.value, 1)
+            self.assertEqual(root.node.unwrap().b.value, 2)
+            self.assertEqual(bytes(root.data), (0x1337).to_bytes(8, "little"))
+
+            view = memory[0x400010:0x400018]
+            self.assertIsInstance(view, memoryview)
+            self.assertEqual(view, (0x1337).to_bytes(8, "little"))
+            view.release()
+
+            with self.assertRaises(IndexError):
+                memory[0x500000:0x500008]
+
+            with self.assertRaises(IndexError):
+                memory[0x400FFC:0x401004]
+
+            with self.assertRaises(ValueError):
+                root.data.value = 1
+
+    def test_writable(self):
+        self.file.write(b"\x00" * 0x100)
+        self.file.flush()
+
+        with MappedMemory(self.file.name, base_address=0x1000, writable=True) as memory:
+            test = inflater(memory).inflate(c_long, 0x1010)
+            test.value = 0x1234
+
+            self.assertEqual(test.value, 0x1234)
+
+        # Writes are never written back to the file
+        with open(self.file.name, "rb") as f:
+            self.assertEqual(f.read(), b"\x00" * 0x100)
+
+    def test_elf_core(self):
+        class test_t(struct):
+            a: c_long
+            b: c_long
+
+        def phdr(p_type, offset, vaddr, filesz, memsz):
+            return struct_module.pack("<IIQQQQQQ", p_type, 6, offset, vaddr, 0, filesz, memsz, 0x1000)
+
+        headers = [
+            phdr(4, 0, 0, 0, 0),  # PT_NOTE
+            phdr(1, 0x1000, 0x10000, 0x1000, 0x1000),
+            phdr(1, 0x2000, 0x11000, 0x800, 0x1000),
+            phdr(1, 0x3000, 0x20000, 0x1000, 0x1000),
+        ]
+
+        ehdr = b"\x7fELF\x02\x01\x01" + b"\x00" * 9
+        ehdr += struct_module.pack("<HHIQQQIHHHHHH", 4, 62, 1, 0, 64, 0, 0, 64, 56, len(headers), 0, 0, 0)
+
+        data = bytearray(0x4000)
+        data[: len(ehdr)] = ehdr
+        data[64 : 64 + 56 * len(headers)] = b"".join(headers)
+        data[0x1FF8:0x2000] = (0x1111).to_bytes(8, "little")
+        data[0x2000:0x2008] = (0x2222).to_bytes(8, "little")
+        data[0x3000:0x3008] = (0x3333).to_bytes(8, "little")
+
+        self.file.write(data)
+        self.file.flush()
+
+        with ElfCore(self.file.name) as core:
+            self.assertEqual(core.load_segments, [(0x10000, 0x1000, 6), (0x11000, 0x1000, 6), (0x20000, 0x1000, 6)])
+            self.assertEqual(core.memory_map.region_for(0x11000), (0x11000, 0x11800, "rw-p", ""))
+            self.assertIsNone(core.memory_map.region_for(0x11800))
+            self.assertTrue(core.memory_map.is_mapped(0x10FF8, 0x10, "rw"))
+            self.assertFalse(core.memory_map.is_mapped(0x117F8, 0x10))
+
+            libdestruct = inflater(core)
+
+            # A struct spanning two segments
+            test = libdestruct.inflate(test_t, 0x10FF8)
+
+            self.assertEqual(test.a.value, 0x1111)
+            self.assertEqual(test.b.value, 0x2222)
+            self.assertEqual(bytes(test), data[0x1FF8:0x2008])
+
+            # The part of a segment not stored in the file was not dumped
+            with self.assertRaises(IndexError):
+                core[0x117FC:0x11804]
+
+            with self.assertRaises(IndexError):
+                core[0x11800:0x11808]
+
+            self.assertEqual(libdestruct.inflate(c_long, 0x20000).value, 0x3333)
+
+            with self.assertRaises(IndexError):
+                core[0x0:0x8]
+
+        with ElfCore(self.file.name, zero_fill=True) as core:
+            # Unless it is explicitly read as zeroes, and marked as such in the memory map
+            self.assertEqual(core[0x117FC:0x11804], b"\x00" * 8)
+            self.assertEqual(core.memory_map.region_for(0x11800), (0x11800, 0x12000, "rw-p", "[not dumped]"))
+            self.assertTrue(core.memory_map.is_mapped(0x117F8, 0x10))
+
+            with self.assertRaises(IndexError):
+                core[0x11FF8:0x12008]
+
+        with tempfile.NamedTemporaryFile() as empty, self.assertRaises(ValueError):
+            MappedMemory(empty.name)
+
+        closed = []
+
+        class tracked_core(ElfCore):
+            def close(self):
+                super().close()
+                closed.append(self.memory.closed)
+
+        # The file is unmapped when it is rejected
+        with self.assertRaises(ValueError):
+            tracked_core(__file__)
+
+        self.assertEqual(closed, [True])
@@ -0,0 +1,128 @@
+#
+# This file is part of libdestruct (https://github.com/mrindeciso/libdestruct).
+# Copyright (c) 2024 Roberto Alessandro Bertolini. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+import tempfile
+import unittest
+
+from collections.abc import MutableSequence
+
+from libdestruct import inflater, c_int, c_long, struct
+from libdestruct.backing.mapped_memory import MappedMemory
+from libdestruct.backing.page_cache import PageCache
+
+class CountingMemory(MutableSequence):
+    def __init__(self, size):
+        self.data = bytearray(size)
+        self.reads = 0
+        self.writes = 0
+
+    def __getitem__(self, key):
+        self.reads += 1
+        return bytes(self.data[key])
+
+    def __setitem__(self, key, value):
+        self.writes += 1
+        self.data[key] = value
+
+    def __delitem__(self, key):
+        raise NotImplementedError
+
+    def __len__(self):
+        return len(self.data)
+
+    def insert(self, index, value):
+        raise NotImplementedError
+
+class StrictMemory(CountingMemory):
+    def __getitem__(self, key):
+        if isinstance(key, slice) and key.stop > len(self.data):
+            raise ValueError("bad")
+
+        return super().__getitem__(key)
+
+class PageCacheTest(unittest.TestCase):
+    def test_read_through(self):
+        class test_t(struct):
+            a: c_int
+            b: c_int
+            c: c_long
+            d: c_long
+
+        memory = CountingMemory(0x3000)
+
+        for i in range(4):
+            memory.data[0xFF8 + i * 8 : 0x1000 + i * 8] = (i + 1).to_bytes(8, "little")
+
+        cache = PageCache(memory)
+        libdestruct = inflater(cache)
+
+        test = libdestruct.inflate(test_t, 0xFF8)
+
+        self.assertEqual(test.a.value, 1)
+        self.assertEqual(test.b.value, 0)
+        self.assertEqual(test.c.value, 2)
+        self.assertEqual(test.d.value, 3)
+
+        # The struct spans two pages, each one fetched exactly once
+        self.assertEqual(memory.reads, 2)
+
+        test.d.value = 0x1234
+
+        self.assertEqual(memory.writes, 1)
+        self.assertEqual(test.d.value, 0x1234)
+        self.assertEqual(memory.data[0x1008:0x1010], (0x1234).to_bytes(8, "little"))
+        self.assertEqual(memory.reads, 2)
+
+        # Changes made behind the cache are only visible after an invalidation
+        memory.data[0xFF8:0x1000] = (0x5678).to_bytes(8, "little")
+
+        self.assertEqual(test.a.value, 1)
+
+        generation = cache.generation
+        cache.invalidate()
+
+        self.assertEqual(cache.generation, generation + 1)
+        self.assertEqual(test.a.value, 0x5678)
+        self.assertEqual(memory.reads, 3)
+
+    def test_short_memory(self):
+        cache = PageCache(b"\x01\x02\x03\x04\x05", page_size=4)
+
+        self.assertEqual(cache[1:5], b"\x02\x03\x04\x05")
+        self.assertEqual(cache[3:10], b"\x04\x05")
+        self.assertEqual(cache[4], 5)
+        self.assertEqual(len(cache), 5)
+
+        with self.assertRaises(ValueError):
+            PageCache(b"", page_size=3)
+
+    def test_mapped_memory(self):
+        with tempfile.NamedTemporaryFile() as file:
+            file.write(bytes(range(100)))
+            file.flush()
+
+            # Neither the image nor its only segment end on a page boundary
+            with MappedMemory(file.name, [(0x1010, 100, 0)]) as memory:
+                cache = PageCache(memory)
+
+                self.assertEqual(cache[0x1010:0x1014], bytes(range(4)))
+                self.assertEqual(cache[0x1070:0x1074], bytes(range(96, 100)))
+                self.assertEqual(inflater(cache).inflate(c_int, 0x1060).value, int.from_bytes(bytes(range(80, 84)), "little"))
+
+                with self.assertRaises(IndexError):
+                    cache[0x1072:0x1076]
+
+                with self.assertRaises(IndexError):
+                    cache[0x1000:0x1004]
+
+            with MappedMemory(file.name) as memory:
+                cache = PageCache(memory)
+
+                self.assertEqual(inflater(cache).inflate(c_int, 0).value, int.from_bytes(bytes(range(4)), "little"))
+                self.assertEqual(cache[96:100], bytes(range(96, 100)))
+
+                with self.assertRaises(IndexError):
+                    cache[0x64:0x68]
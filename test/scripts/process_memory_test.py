@@ -0,0 +1,106 @@
+#
+# This file is part of libdestruct (https://github.com/mrindeciso/libdestruct).
+# Copyright (c) 2024 Roberto Alessandro Bertolini. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+import ctypes
+import os
+import unittest
+
+from libdestruct import inflater, c_int, c_long, ptr, ptr_to, struct
+from libdestruct.backing.memory_map import MemoryMap, parse_proc_maps
+from libdestruct.backing.process_memory import ProcessMemory
+
+from scripts.page_cache_test import CountingMemory
+
+class ProcessMemoryTest(unittest.TestCase):
+    def test_own_process(self):
+        class node_t(struct):
+            a: c_int
+            b: c_int
+
+        class root_t(struct):
+            x: c_long
+            node: ptr = ptr_to(node_t)
+
+        class native_node_t(ctypes.Structure):
+            _fields_ = [("a", ctypes.c_int), ("b", ctypes.c_int)]
+
+        class native_root_t(ctypes.Structure):
+            _fields_ = [("x", ctypes.c_long), ("node", ctypes.c_void_p)]
+
+        node = native_node_t(1, 2)
+        root = native_root_t(0x1337, ctypes.addressof(node))
+
+        memory = ProcessMemory(os.getpid())
+        libdestruct = inflater(memory)
+
+        test = libdestruct.inflate(root_t, ctypes.addressof(root))
+
+        self.assertEqual(test.x.value, 0x1337)
+        self.assertEqual(test.node.unwrap().a.value, 1)
+        self.assertEqual(test.node.unwrap().b.value, 2)
+
+        test.node.unwrap().b.value = 3
+        test.x.value = 0x7331
+
+        self.assertEqual(node.b, 3)
+        self.assertEqual(root.x, 0x7331)
+
+        # Many ranges are read with vectored I/O, in batches
+        ranges = [(ctypes.addressof(root), 8), (ctypes.addressof(node) + 4, 4)] * 600
+        results = test.resolver.resolve_many(ranges)
+
+        self.assertEqual(len(results), 1200)
+        self.assertEqual(results[0], (0x7331).to_bytes(8, "little"))
+        self.assertEqual(results[-1], (3).to_bytes(4, "little"))
+
+        with self.assertRaises(ValueError):
+            memory[0:8]
+
+        with self.assertRaises(ValueError):
+            memory.read_many([(ctypes.addressof(root), 8), (0x10, 8)])
+
+    def test_memory_map(self):
+        class node_t(struct):
+            a: c_long
+
+        class root_t(struct):
+            good: ptr = ptr_to(node_t)
+            bad: ptr = ptr_to(node_t)
+
+        node = ctypes.c_long(0x1337)
+        root = (ctypes.c_void_p * 2)(ctypes.addressof(node), 0x10)
+
+        memory = ProcessMemory(os.getpid())
+        test = inflater(memory).inflate(root_t, ctypes.addressof(root))
+
+        self.assertIs(test.resolver.memory_map, memory.memory_map)
+        self.assertEqual(test.good.try_unwrap().a.value, 0x1337)
+        self.assertIsNone(test.bad.try_unwrap())
+
+        region = memory.memory_map.region_for(ctypes.addressof(node))
+        self.assertIn("rw", region[2])
+        self.assertIn(ctypes.addressof(node), memory.memory_map)
+
+        memory.memory_map.refresh()
+        self.assertTrue(memory.memory_map.is_mapped(ctypes.addressof(node), 8, "rw"))
+
+        # Maps can also be provided explicitly, and reject bad pointers without touching memory
+        backing = CountingMemory(0x100)
+        backing.data[0:8] = (0x80).to_bytes(8, "little")
+        backing.data[8:16] = (0x400).to_bytes(8, "little")
+        backing.data[0x80:0x88] = (0x1234).to_bytes(8, "little")
+
+        memory_map = MemoryMap(parse_proc_maps("0-100 rw-p 00000000 00:00 0\n"))
+        test = inflater(backing, memory_map).inflate(root_t, 0)
+
+        self.assertEqual(test.good.try_unwrap().a.value, 0x1234)
+        reads = backing.reads
+        self.assertIsNone(test.bad.try_unwrap())
+        self.assertEqual(backing.reads, reads + 1)
+
+        self.assertFalse(memory_map.is_mapped(0xFC, 8))
+        self.assertFalse(memory_map.is_mapped(0x0, 8, "x"))
+        self.assertIsNone(memory_map.region_for(0x100))
@@ -0,0 +1,158 @@
+#
+# This file is part of libdestruct (https://github.com/mrindeciso/libdestruct).
+# Copyright (c) 2024 Roberto Alessandro Bertolini. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+import unittest
+
+from libdestruct import inflater, c_int, c_long, ptr, ptr_to_self, struct
+from libdestruct.backing.fake_resolver import FakeResolver
+from libdestruct.backing.identity_map import IdentityMap
+
+from scripts.page_cache_test import CountingMemory
+
+class ResolverTest(unittest.TestCase):
+    def test_rebase(self):
+        class inner_t(struct):
+            x: c_int
+            y: c_int
+
+        class outer_t(struct):
+            a: c_long
+            b: inner_t
+
+        memory = bytearray(0x100)
+
+        for i in range(2):
+            base = i * 0x80
+            memory[base : base + 8] = (0x10 + i).to_bytes(8, "little")
+            memory[base + 8 : base + 12] = (0x20 + i).to_bytes(4, "little")
+            memory[base + 12 : base + 16] = (0x30 + i).to_bytes(4, "little")
+
+        libdestruct = inflater(memory)
+
+        test = libdestruct.inflate(outer_t, 0)
+
+        self.assertEqual(test.b.y.address, 12)
+        self.assertEqual(test.a.value, 0x10)
+        self.assertEqual(test.b.x.value, 0x20)
+        self.assertEqual(test.b.y.value, 0x30)
+
+        test.rebase(0x80)
+
+        self.assertEqual(test.address, 0x80)
+        self.assertEqual(test.b.address, 0x88)
+        self.assertEqual(test.b.y.address, 0x8C)
+        self.assertEqual(test.a.value, 0x11)
+        self.assertEqual(test.b.x.value, 0x21)
+        self.assertEqual(test.b.y.value, 0x31)
+
+        test.b.y.value = 0x41
+
+        self.assertEqual(memory[0x8C:0x90], (0x41).to_bytes(4, "little"))
+
+        # A rebased resolver leaves its children stale until they are invalidated
+        resolver = test.resolver
+        child = resolver.relative_from_own(8, 0)
+
+        resolver.rebase(0)
+        self.assertEqual(child.resolve_address(), 0x88)
+
+        child.invalidate()
+        self.assertEqual(child.resolve_address(), 0x8)
+
+    def test_fake_resolver(self):
+        class test_t(struct):
+            a: c_int
+            b: c_long
+
+        test = test_t(a=1, b=0x1234)
+
+        self.assertEqual(test.a.value, 1)
+        self.assertEqual(test.b.value, 0x1234)
+        self.assertEqual(bytes(test), b"\x01\x00\x00\x00" + (0x1234).to_bytes(8, "little"))
+
+        # Reads and writes spanning pages, including pages never written
+        resolver = FakeResolver({0x1000: b"\x01" * 0x1000})
+        child = resolver.relative_from_own(0xFFC, 0)
+
+        self.assertEqual(child.resolve(8, 0), b"\x00" * 4 + b"\x01" * 4)
+        self.assertEqual(resolver.relative_from_own(0x1FFE, 0).resolve(4, 0), b"\x01\x01\x00\x00")
+
+        child.modify(0x1008, 0, b"\x02" * 0x1008)
+
+        self.assertEqual(child.resolve(0x100A, 0), b"\x02" * 0x1008 + b"\x00\x00")
+        self.assertIsInstance(resolver.memory[0x1000], bytearray)
+        self.assertEqual(resolver.memory[0x1000], b"\x02" * 0x1000)
+
+    def test_resolve_many(self):
+        memory = CountingMemory(0x100)
+        memory.data[:] = bytes(range(0x100))
+
+        resolver = inflater(memory).inflate(c_int, 0x10).resolver
+
+        ranges = [(0x40, 4), (0x10, 8), (0x18, 4), (0x14, 2), (0x80, 1), (0x10, 0)]
+        expected = [bytes(memory.data[address : address + size]) for address, size in ranges]
+
+        self.assertEqual(resolver.resolve_many(ranges), expected)
+        # 0x10-0x1c is read once, then 0x40-0x44 and 0x80-0x81
+        self.assertEqual(memory.reads, 3)
+
+        fake = FakeResolver()
+        fake.absolute_from_own(0x1000).modify(4, 0, b"\x01\x02\x03\x04")
+
+        self.assertEqual(fake.resolve_many([(0x1002, 2), (0x0, 1)]), [b"\x03\x04", b"\x00"])
+        self.assertEqual(resolver.resolve_many([]), [])
+
+    def test_identity_map(self):
+        class node_t(struct):
+            key: c_long
+            next: ptr = ptr_to_self()
+
+        memory = bytearray(0x100)
+
+        # A two-node cycle
+        memory[0x00:0x10] = (1).to_bytes(8, "little") + (0x40).to_bytes(8, "little")
+        memory[0x40:0x50] = (2).to_bytes(8, "little") + (0x00).to_bytes(8, "little")
+
+        identity_map = IdentityMap(max_size=2)
+        lib = inflater(memory, identity_map=identity_map)
+
+        head = lib.inflate(node_t, 0)
+        self.assertIs(lib.inflate(node_t, 0), head)
+        self.assertIsNot(lib.inflate(c_long, 0), head)
+
+        second = head.next.unwrap()
+        self.assertIs(second.next.unwrap(), head)
+        self.assertIs(head.next.unwrap(), second)
+
+        # Frozen state survives a second unwrap
+        second.freeze()
+        memory[0x40:0x48] = (3).to_bytes(8, "little")
+        self.assertEqual(head.next.unwrap().key.value, 2)
+
+        lib.invalidate(0x40)
+        self.assertIsNot(head.next.unwrap(), second)
+
+        # Rebased objects are recorded under their new address
+        moved = lib.inflate(node_t, 0x10)
+        moved.rebase(0x30)
+        self.assertEqual(lib.inflate(node_t, 0x10).address, 0x10)
+        self.assertIs(lib.inflate(node_t, 0x30), moved)
+
+        # The least recently used entries are evicted
+        others = [lib.inflate(c_long, 0x80), lib.inflate(c_long, 0x88)]
+        self.assertEqual(len(identity_map), 2)
+        self.assertIsNot(lib.inflate(node_t, 0), head)
+        self.assertIs(lib.inflate(c_long, 0x88), others[1])
+
+        lib.invalidate()
+        self.assertEqual(len(identity_map), 0)
+
+        # Entries are dropped with their objects
+        lib.inflate(node_t, 0x40)
+        self.assertEqual(len(identity_map), 0)
+
+        # Without an identity map, every inflation creates a new object
+        self.assertIsNot(inflater(memory).inflate(node_t, 0), inflater(memory).inflate(node_t, 0))
@@ -4,10 +4,15 @@
 # Licensed under the MIT license. See LICENSE file in the project root for details.
 #
 
+import tempfile
 import unittest
 
 from libdebug import debugger
-from libdestruct import inflater, c_str
+from libdestruct import array_of, inflater, c_str, ptr_to
+from libdestruct.backing.mapped_memory import MappedMemory
+from libdestruct.backing.memory_resolver import MemoryResolver
+
+from scripts.page_cache_test import CountingMemory
 
 class StringTest(unittest.TestCase):
     def test_basic(self):
@@ -49,3 +54,112 @@ class StringTest(unittest.TestCase):
         self.assertEqual(check.hit_count, 0)
 
         d.terminate()
+
+    def test_scan(self):
+        memory = CountingMemory(0x3000)
+        memory.data[0xF00 : 0x2100] = b"A" * 0x1200
+        lib = inflater(memory)
+
+        string = lib.inflate(c_str, 0xF00)
+
+        # The string is scanned in page-aligned chunks
+        memory.reads = 0
+        self.assertEqual(string.value, b"A" * 0x1200)
+        self.assertEqual(memory.reads, 3)
+
+        # The length found by the scan is reused, and verified with a single read
+        memory.reads = 0
+        self.assertEqual(len(string), 0x1200)
+        self.assertEqual(string[5], b"A")
+        self.assertEqual(b"".join(string)[:4], b"AAAA")
+        self.assertEqual(memory.reads, 3)
+
+        # The hint is discarded when the string is changed behind our back
+        memory.data[0xF04] = 0
+        self.assertEqual(string.value, b"AAAA")
+        memory.data[0xF04] = ord("B")
+        self.assertEqual(string.value, b"AAAAB" + b"A" * (0x1200 - 5))
+
+        string.value = b"xyz\x00"
+        self.assertEqual(string.value, b"xyz")
+
+        # Strings can be truncated, and need no terminator within their maximum length
+        bounded = c_str(lib.inflate(c_str, 0x1000).resolver, max_length=16)
+        self.assertEqual(bounded.value, b"A" * 16)
+        self.assertEqual(len(bounded), 16)
+
+        unterminated = inflater(b"ABC").inflate(c_str, 0)
+        with self.assertRaises(RuntimeError):
+            unterminated.count()
+
+    def test_string_table(self):
+        memory = CountingMemory(0x4000)
+        strings = [b"first", b"B" * 0x1100, b"", b"last"]
+        addresses = [0x1000, 0x1FF0, 0x3100, 0x3200]
+
+        for address, string in zip(addresses, strings):
+            memory.data[address : address + len(string) + 1] = string + b"\x00"
+
+        table = addresses[:2] + [0] + addresses[2:]
+        memory.data[0 : 8 * len(table)] = b"".join(address.to_bytes(8, "little") for address in table)
+
+        argv = inflater(memory).inflate(array_of(ptr_to(c_str), len(table)), 0)
+
+        # One read for the pointers, two for the first pages, then one for each further page of the long string
+        memory.reads = 0
+        self.assertEqual(argv.read_strings(), strings[:2] + [None] + strings[2:])
+        self.assertEqual(memory.reads, 5)
+
+        self.assertEqual(argv.read_strings(max_length=8), [b"first", b"B" * 8, None, b"", b"last"])
+        self.assertEqual(argv[1].unwrap().value, strings[1])
+
+    def test_mapped_image(self):
+        with tempfile.NamedTemporaryFile() as file:
+            data = bytearray(100)
+            data[0:6] = b"hello\x00"
+            data[90:94] = b"end\x00"
+            data[94:100] = b"B" * 6
+            file.write(data)
+            file.flush()
+
+            # The size of the image is not a multiple of the page size
+            with MappedMemory(file.name) as memory:
+                lib = inflater(memory)
+
+                self.assertEqual(lib.inflate(c_str, 0).get(), b"hello")
+                self.assertEqual(lib.inflate(c_str, 90).get(), b"end")
+
+                with self.assertRaises(RuntimeError):
+                    lib.inflate(c_str, 94).get()
+
+                # Without a memory map, the reads past the end of the image are retried with shorter ones
+                string = c_str(MemoryResolver(memory, 90))
+                self.assertEqual(string.get(), b"end")
+                self.assertEqual(string.get(), b"end")
+
+                with self.assertRaises(RuntimeError):
+                    c_str(MemoryResolver(memory, 94)).get()
+
+    def test_mapped_string_table(self):
+        with tempfile.NamedTemporaryFile() as file:
+            data = bytearray(100)
+            table = [0x30, 90, 0, 94, 0x200]
+            data[0 : 8 * len(table)] = b"".join(address.to_bytes(8, "little") for address in table)
+            data[0x30:0x36] = b"hello\x00"
+            data[90:94] = b"end\x00"
+            data[94:100] = b"B" * 6
+            file.write(data)
+            file.flush()
+
+            expected = [b"hello", b"end", None, None, None]
+
+            with MappedMemory(file.name) as memory:
+                lib = inflater(memory)
+
+                # The reads are clipped to the end of the image through its memory map
+                self.assertEqual(lib.inflate(array_of(ptr_to(c_str), len(table)), 0).read_strings(), expected)
+
+                # Without a memory map, the batched read fails and the strings are read one by one
+                unmapped = lib.inflate(array_of(ptr_to(c_str), len(table)), MemoryResolver(memory, 0))
+                self.assertEqual(unmapped.read_strings(), expected)
+                self.assertEqual(unmapped.read_strings(max_length=2), [b"he", b"en", None, b"BB", None])
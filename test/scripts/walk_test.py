@@ -0,0 +1,188 @@
+#
+# This file is part of libdestruct (https://github.com/mrindeciso/libdestruct).
+# Copyright (c) 2024 Roberto Alessandro Bertolini. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+import unittest
+
+from libdestruct import array, array_of, explore, inflater, c_int, c_long, ptr, ptr_to, ptr_to_self, struct, walk
+from libdestruct.backing.memory_map import MemoryMap
+
+from scripts.page_cache_test import CountingMemory, StrictMemory
+
+class node_t(struct):
+    key: c_long
+    flags: c_int
+    next: ptr = ptr_to_self()
+
+def build_list(memory, addresses, values):
+    for index, address in enumerate(addresses):
+        following = addresses[index + 1] if index + 1 < len(addresses) else 0
+        memory[address : address + 8] = values[index].to_bytes(8, "little", signed=True)
+        memory[address + 8 : address + 12] = index.to_bytes(4, "little")
+        memory[address + 12 : address + 20] = following.to_bytes(8, "little")
+
+class WalkTest(unittest.TestCase):
+    def test_walk(self):
+        memory = bytearray(0x1000)
+        addresses = [0x100, 0x400, 0x200, 0x800]
+        build_list(memory, addresses, [10, -20, 30, 40])
+
+        head = inflater(memory).inflate(node_t, 0x100)
+
+        nodes = list(walk(head, "next"))
+
+        # The same cursor is moved onto every node
+        self.assertEqual(len(nodes), 4)
+        self.assertTrue(all(node is nodes[0] for node in nodes))
+        self.assertEqual(nodes[0].address, 0x800)
+
+        self.assertEqual([node.key.value for node in walk(head, "next")], [10, -20, 30, 40])
+        self.assertEqual([node.address for node in walk(head, "next", limit=2)], [0x100, 0x400])
+
+        # The head is left untouched
+        self.assertEqual(head.address, 0x100)
+
+        self.assertEqual(
+            list(walk(head, "next", fields=["key", "flags"])),
+            [{"key": 10, "flags": 0}, {"key": -20, "flags": 1}, {"key": 30, "flags": 2}, {"key": 40, "flags": 3}],
+        )
+
+        with self.assertRaises(ValueError):
+            walk(head, "prev")
+
+        with self.assertRaises(TypeError):
+            walk(head, "key")
+
+        with self.assertRaises(ValueError):
+            walk(head, "next", fields=["missing"])
+
+    def test_walk_cycle(self):
+        memory = bytearray(0x1000)
+        addresses = [0x100, 0x200, 0x300]
+        build_list(memory, addresses, [1, 2, 3])
+
+        # Close the list onto its second node
+        memory[0x300 + 12 : 0x300 + 20] = (0x200).to_bytes(8, "little")
+
+        head = inflater(memory).inflate(node_t, 0x100)
+
+        self.assertEqual([node.key.value for node in walk(head, "next")], [1, 2, 3])
+        self.assertEqual([node["key"] for node in walk(head, "next", fields=["key"])], [1, 2, 3])
+
+    def test_walk_unmapped(self):
+        memory = bytearray(0x2000)
+        addresses = [0x100, 0x200, 0x1100]
+        build_list(memory, addresses, [1, 2, 3])
+
+        memory_map = MemoryMap([(0, 0x1000, "rw-p", "")])
+        head = inflater(memory, memory_map).inflate(node_t, 0x100)
+
+        self.assertEqual([node.key.value for node in walk(head, "next")], [1, 2])
+
+    def test_walk_reads(self):
+        memory = CountingMemory(0x10000)
+        addresses = list(range(0x100, 0x10000, 0x100))
+        build_list(memory.data, addresses, list(range(len(addresses))))
+
+        head = inflater(memory).inflate(node_t, 0x100)
+
+        # A single read per node, spanning the requested members and the link
+        memory.reads = 0
+        values = [node["key"] for node in walk(head, "next", fields=["key"])]
+        self.assertEqual(values, list(range(len(addresses))))
+        self.assertEqual(memory.reads, len(addresses))
+
+    def test_explore(self):
+        class owner_t(struct):
+            id: c_int
+
+        class tree_t(struct):
+            key: c_long
+            left: ptr = ptr_to_self()
+            right: ptr = ptr_to_self()
+            owner: ptr = ptr_to(owner_t)
+
+        class root_t(struct):
+            tree: tree_t
+            count: c_int
+
+        memory = CountingMemory(0x1000)
+
+        def write_tree(address, key, left, right, owner):
+            memory.data[address : address + 32] = b"".join(
+                value.to_bytes(8, "little") for value in (key, left, right, owner)
+            )
+
+        write_tree(0x100, 1, 0x200, 0x220, 0x800)
+        memory.data[0x120:0x124] = (2).to_bytes(4, "little")
+        write_tree(0x200, 2, 0x300, 0x100, 0)
+        write_tree(0x220, 3, 0x300, 0, 0x800)
+        write_tree(0x300, 4, 0, 0x900, 0)
+        memory.data[0x800:0x804] = (7).to_bytes(4, "little")
+
+        root = inflater(memory, MemoryMap([(0, 0x900, "rw-p", "")])).inflate(root_t, 0x100)
+
+        # Each level is fetched with one read per contiguous run of nodes
+        memory.reads = 0
+        nodes = list(explore(root))
+        self.assertEqual(memory.reads, 5)
+
+        self.assertEqual(
+            [(node.__class__.__name__, node.address) for node in nodes],
+            [("root_t", 0x100), ("tree_t", 0x200), ("tree_t", 0x220), ("owner_t", 0x800), ("tree_t", 0x300), ("tree_t", 0x100)],
+        )
+
+        # The nodes are frozen snapshots
+        memory.data[0x200:0x208] = (20).to_bytes(8, "little")
+        self.assertEqual(nodes[1].key.value, 2)
+        self.assertEqual(nodes[3].id.value, 7)
+        self.assertEqual(nodes[0].tree.left.value, 0x200)
+
+        self.assertEqual([node.address for node in explore(root, depth=1)], [0x100, 0x200, 0x220, 0x800])
+        self.assertEqual([node.address for node in explore(root, types=[owner_t])], [0x800])
+        self.assertEqual([node.address for node in explore(root, follow=[owner_t])], [0x100, 0x800])
+
+    def test_explore_tables(self):
+        class chunk_t(struct):
+            size: c_long
+
+        class slot_t(struct):
+            tag: c_int
+            chunk: ptr = ptr_to(chunk_t)
+
+        class heap_t(struct):
+            count: c_int
+            buckets: array = array_of(ptr_to(chunk_t), 4)
+            slots: array = array_of(slot_t, 2)
+
+        memory = bytearray(0x1000)
+
+        # The pointers live in a table of pointers and in an array of structs
+        buckets = [0x800, 0, 0x810, 0x800]
+        memory[0x104 : 0x124] = b"".join(address.to_bytes(8, "little") for address in buckets)
+        memory[0x128 : 0x130] = (0x820).to_bytes(8, "little")
+        memory[0x134 : 0x13C] = (0x810).to_bytes(8, "little")
+
+        for index, address in enumerate([0x800, 0x810, 0x820]):
+            memory[address : address + 8] = (index + 1).to_bytes(8, "little")
+
+        heap = inflater(memory).inflate(heap_t, 0x100)
+
+        chunks = list(explore(heap, types=[chunk_t]))
+        self.assertEqual([(chunk.address, chunk.size.value) for chunk in chunks], [(0x800, 1), (0x810, 2), (0x820, 3)])
+
+    def test_explore_unreadable(self):
+        class node_t(struct):
+            key: c_long
+            left: ptr = ptr_to_self()
+            right: ptr = ptr_to_self()
+
+        memory = StrictMemory(0x100)
+        memory.data[0x00:0x18] = b"".join(value.to_bytes(8, "little") for value in (1, 0x40, 0xDEADBEEF))
+        memory.data[0x40:0x58] = b"".join(value.to_bytes(8, "little") for value in (2, 0, 0))
+
+        # Without a memory map, the garbage pointer fails the batched read, and only its target is skipped
+        root = inflater(memory).inflate(node_t, 0)
+        self.assertEqual([node.key.value for node in explore(root)], [1, 2])
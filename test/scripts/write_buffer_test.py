@@ -0,0 +1,89 @@
+#
+# This file is part of libdestruct (https://github.com/mrindeciso/libdestruct).
+# Copyright (c) 2024 Roberto Alessandro Bertolini. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+import unittest
+
+from libdestruct import inflater, c_int, c_long, struct
+from libdestruct.backing.page_cache import PageCache
+from libdestruct.backing.write_buffer import WriteBuffer
+
+from scripts.page_cache_test import CountingMemory
+
+class WriteBufferTest(unittest.TestCase):
+    def test_coalescing(self):
+        class test_t(struct):
+            a: c_int
+            b: c_int
+            c: c_long
+            d: c_long
+            e: c_long
+
+        memory = CountingMemory(0x100)
+        buffer = WriteBuffer(memory)
+        libdestruct = inflater(buffer)
+
+        test = libdestruct.inflate(test_t, 0x10)
+
+        with buffer:
+            test.a.value = 1
+            test.b.value = 2
+            test.d.value = 4
+            test.c.value = 3
+            test.e.value = 5
+
+            # Pending writes are visible, but not yet written
+            self.assertEqual(test.b.value, 2)
+            self.assertEqual(memory.writes, 0)
+            self.assertEqual(buffer.pending, [(0x10, 32)])
+
+        self.assertEqual(memory.writes, 1)
+        self.assertEqual(buffer.pending, [])
+        self.assertEqual(test.c.value, 3)
+        self.assertEqual(bytes(memory.data[0x10:0x30]), bytes(test))
+
+    def test_disjoint_ranges(self):
+        memory = CountingMemory(0x100)
+        buffer = WriteBuffer(memory)
+
+        buffer[0x20:0x24] = b"\x01\x02\x03\x04"
+        buffer[0x40:0x42] = b"\x05\x06"
+        buffer[0x10:0x12] = b"\x07\x08"
+        buffer[0x22:0x28] = b"\x09" * 6
+
+        self.assertEqual(buffer.pending, [(0x10, 2), (0x20, 8), (0x40, 2)])
+        self.assertEqual(buffer[0x1E:0x2A], b"\x00\x00\x01\x02" + b"\x09" * 6 + b"\x00\x00")
+
+        # A write bridging two ranges merges them
+        buffer[0x12:0x20] = b"\x0a" * 14
+
+        self.assertEqual(buffer.pending, [(0x10, 24), (0x40, 2)])
+
+        buffer.flush()
+
+        self.assertEqual(memory.writes, 2)
+        self.assertEqual(memory.data[0x10:0x12], b"\x07\x08")
+        self.assertEqual(memory.data[0x40:0x42], b"\x05\x06")
+
+    def test_rollback(self):
+        memory = CountingMemory(0x100)
+        cache = PageCache(memory)
+        libdestruct = inflater(WriteBuffer(cache))
+
+        test = libdestruct.inflate(c_long, 0x8)
+
+        with self.assertRaises(RuntimeError), libdestruct.memory:
+            test.value = 0x1234
+            self.assertEqual(test.value, 0x1234)
+            raise RuntimeError
+
+        self.assertEqual(test.value, 0)
+        self.assertEqual(memory.writes, 0)
+        self.assertEqual(memory.reads, 1)
+
+        test.value = 0x5678
+        libdestruct.memory.discard()
+
+        self.assertEqual(test.value, 0)